@@ -1,3 +1,5 @@
+import asyncio
+import sys
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
@@ -9,11 +11,27 @@ from core.hotstrings import HotstringEngine
 from core.vault_manager import VaultManager
 from core.ai_clients import create_ai_manager_from_settings
 from core.tts_engine import TTSEngine
+from core.audio_engine import warmup as warmup_audio_engine
+from core.startup_modal import get_app_icon
 from ui.main_window import create_main_window
 from ui.api_key_dialog import ApiKeyDialog
 
 
+def _install_fast_event_loop() -> None:
+    """Use winloop/uvloop for asyncio when installed; keep the default otherwise."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+
+
 def main() -> None:
+    _install_fast_event_loop()
+
     base_dir = Path(__file__).resolve().parent
     config_dir = base_dir / "config"
     config_dir.mkdir(exist_ok=True)
@@ -23,6 +41,8 @@ def main() -> None:
     settings.load()
 
     app = QApplication([])
+    # Set once here so every window and dialog inherits it.
+    app.setWindowIcon(get_app_icon())
 
     # First-run API key dialog
     if settings.is_first_run():
@@ -42,8 +62,12 @@ def main() -> None:
     registry.load()
 
     vault = VaultManager(config_dir / "vault.json")
+    vault.load()
     ai_manager = create_ai_manager_from_settings(settings)
     tts_engine = TTSEngine()
+    # Voice list and Whisper model load while the window is being built.
+    tts_engine.warmup()
+    warmup_audio_engine(tts_engine)
 
     # Hotkeys + hotstrings
     register_hotkeys(registry)
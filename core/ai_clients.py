@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
-import openai
-import anthropic
+from typing import AsyncIterator, Dict, List, Optional, Any
+
+from .response_cache import ResponseCache
 
 
 @dataclass
@@ -19,19 +21,135 @@ class AIResponse:
     raw_response: Optional[Any] = None
 
 
+# One pooled HTTP client per event loop, shared by every provider client.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _shared_http_client() -> Any:
+    """Return the keep-alive httpx client for the running event loop.
+
+    httpx connections belong to the loop that opened them, so the pool is
+    per loop; every OpenAI/Claude client on that loop reuses its sockets and
+    TLS sessions. HTTP/2 is used when the optional h2 package is installed.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        import httpx
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def cached(func):
+    """Serve chat_completion from the client's ResponseCache when possible.
+
+    Pass bypass_cache=True to always hit the API (the fresh response is
+    still stored).
+    """
+    @functools.wraps(func)
+    async def wrapper(self: AIClient, messages: List[Dict[str, str]],
+                      temperature: float = 0.7, max_tokens: Optional[int] = None,
+                      bypass_cache: bool = False) -> AIResponse:
+        cache = self.cache
+        if cache is None:
+            return await func(self, messages, temperature, max_tokens)
+
+        key = cache.make_key(self.get_provider_name(), self.model, messages, temperature, max_tokens)
+        # ResponseCache does blocking sqlite I/O; keep it off the event loop.
+        if not bypass_cache:
+            hit = await asyncio.to_thread(cache.get, key)
+            if hit is not None:
+                return AIResponse(**hit)
+
+        response = await func(self, messages, temperature, max_tokens)
+        await asyncio.to_thread(cache.put, key, {
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "usage": response.usage,
+        })
+        return response
+
+    return wrapper
+
+
 class AIClient(ABC):
     """Abstract base class for AI API clients."""
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, cache: Optional[ResponseCache] = None):
         self.api_key = api_key
         self.model = model
+        self.cache = cache
+        self._sdk_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> Any:
+        """Provider SDK client for the running loop, on the shared HTTP pool."""
+        loop = asyncio.get_running_loop()
+        client = self._sdk_clients.get(loop)
+        if client is None:
+            client = self._create_sdk_client(_shared_http_client())
+            self._sdk_clients[loop] = client
+        return client
+
+    @abstractmethod
+    def _create_sdk_client(self, http_client: Any) -> Any:
+        """Build the provider SDK client on top of http_client."""
+        pass
 
     @abstractmethod
     async def chat_completion(self, messages: List[Dict[str, str]],
-                           temperature: float = 0.7, max_tokens: Optional[int] = None) -> AIResponse:
+                           temperature: float = 0.7, max_tokens: Optional[int] = None,
+                           bypass_cache: bool = False) -> AIResponse:
         """Send a chat completion request."""
         pass
 
+    @abstractmethod
+    def _stream(self, messages: List[Dict[str, str]], temperature: float,
+                max_tokens: Optional[int]) -> AsyncIterator[str]:
+        """Yield response text chunks straight from the provider."""
+        pass
+
+    async def chat_completion_stream(self, messages: List[Dict[str, str]],
+                                     temperature: float = 0.7, max_tokens: Optional[int] = None,
+                                     bypass_cache: bool = False) -> AsyncIterator[str]:
+        """Yield the response text as the model generates it.
+
+        A cached response is yielded as a single chunk; a completed stream is
+        stored in the cache like a regular chat_completion.
+        """
+        cache = self.cache
+        key = None
+        if cache is not None:
+            key = cache.make_key(self.get_provider_name(), self.model, messages, temperature, max_tokens)
+            if not bypass_cache:
+                hit = await asyncio.to_thread(cache.get, key)
+                if hit is not None:
+                    yield hit["content"]
+                    return
+
+        parts: List[str] = []
+        async for text in self._stream(messages, temperature, max_tokens):
+            parts.append(text)
+            yield text
+
+        if key is not None:
+            await asyncio.to_thread(cache.put, key, {
+                "content": "".join(parts),
+                "model": self.model,
+                "provider": self.get_provider_name(),
+                "usage": None,
+            })
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the provider name."""
@@ -41,13 +159,19 @@ class AIClient(ABC):
 class OpenAIClient(AIClient):
     """OpenAI API client."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(api_key, model)
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "gpt-4",
+                 cache: Optional[ResponseCache] = None):
+        super().__init__(api_key, model, cache)
+
+    def _create_sdk_client(self, http_client: Any) -> Any:
+        # Imported here so the SDK only loads when it is actually used.
+        import openai
+        return openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
 
     def get_provider_name(self) -> str:
         return "openai"
 
+    @cached
     async def chat_completion(self, messages: List[Dict[str, str]],
                            temperature: float = 0.7, max_tokens: Optional[int] = None) -> AIResponse:
         try:
@@ -75,47 +199,71 @@ class OpenAIClient(AIClient):
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
 
+    async def _stream(self, messages: List[Dict[str, str]], temperature: float,
+                      max_tokens: Optional[int]) -> AsyncIterator[str]:
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
 
 class ClaudeClient(AIClient):
     """Anthropic Claude API client."""
 
-    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229"):
-        super().__init__(api_key, model)
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229",
+                 cache: Optional[ResponseCache] = None):
+        super().__init__(api_key, model, cache)
+
+    def _create_sdk_client(self, http_client: Any) -> Any:
+        # Imported here so the SDK only loads when it is actually used.
+        import anthropic
+        return anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http_client)
 
     def get_provider_name(self) -> str:
         return "claude"
 
+    def _build_kwargs(self, messages: List[Dict[str, str]], temperature: float,
+                      max_tokens: Optional[int]) -> Dict[str, Any]:
+        # Convert messages to Claude format
+        claude_messages = []
+        system_message = None
+
+        for msg in messages:
+            if msg["role"] == "system":
+                system_message = msg["content"]
+            else:
+                claude_messages.append(msg)
+
+        kwargs = {
+            "model": self.model,
+            "messages": claude_messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens or 4096,
+        }
+
+        if system_message:
+            kwargs["system"] = system_message
+        return kwargs
+
+    @cached
     async def chat_completion(self, messages: List[Dict[str, str]],
                            temperature: float = 0.7, max_tokens: Optional[int] = None) -> AIResponse:
         try:
-            # Convert messages to Claude format
-            claude_messages = []
-            system_message = None
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    claude_messages.append(msg)
-
-            kwargs = {
-                "model": self.model,
-                "messages": claude_messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens or 4096,
-            }
-
-            if system_message:
-                kwargs["system"] = system_message
-
+            kwargs = self._build_kwargs(messages, temperature, max_tokens)
             response = await self.client.messages.create(**kwargs)
 
-            content = ""
-            if response.content:
-                for block in response.content:
-                    if hasattr(block, 'text'):
-                        content += block.text
+            content = "".join(
+                text for block in (response.content or ()) if (text := getattr(block, "text", None))
+            )
 
             usage = {
                 "input_tokens": response.usage.input_tokens if response.usage else 0,
@@ -133,38 +281,76 @@ class ClaudeClient(AIClient):
         except Exception as e:
             raise Exception(f"Claude API error: {str(e)}")
 
+    async def _stream(self, messages: List[Dict[str, str]], temperature: float,
+                      max_tokens: Optional[int]) -> AsyncIterator[str]:
+        try:
+            kwargs = self._build_kwargs(messages, temperature, max_tokens)
+            async with self.client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
+
 
 class AIClientManager:
     """Manages multiple AI clients and provides unified interface."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None):
         self.clients: Dict[str, AIClient] = {}
+        self.cache = cache
 
     def add_client(self, provider: str, api_key: str, model: str) -> None:
         """Add an AI client."""
-        if provider.lower() == "openai":
-            self.clients[provider] = OpenAIClient(api_key, model)
-        elif provider.lower() == "claude":
-            self.clients[provider] = ClaudeClient(api_key, model)
+        # Clients are always stored under the lowercase provider name.
+        key = provider.lower()
+        if key == "openai":
+            self.clients[key] = OpenAIClient(api_key, model, self.cache)
+        elif key == "claude":
+            self.clients[key] = ClaudeClient(api_key, model, self.cache)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
     def get_client(self, provider: str) -> Optional[AIClient]:
         """Get a client by provider name."""
-        return self.clients.get(provider.lower())
+        return self.clients.get(provider if provider.islower() else provider.lower())
 
     def get_available_providers(self) -> List[str]:
         """Get list of available providers."""
         return list(self.clients.keys())
 
     async def chat_completion(self, provider: str, messages: List[Dict[str, str]],
-                           temperature: float = 0.7, max_tokens: Optional[int] = None) -> AIResponse:
+                           temperature: float = 0.7, max_tokens: Optional[int] = None,
+                           bypass_cache: bool = False) -> AIResponse:
         """Send chat completion using specified provider."""
         client = self.get_client(provider)
         if not client:
             raise ValueError(f"No client configured for provider: {provider}")
 
-        return await client.chat_completion(messages, temperature, max_tokens)
+        return await client.chat_completion(messages, temperature, max_tokens, bypass_cache)
+
+    async def chat_completion_stream(self, provider: str, messages: List[Dict[str, str]],
+                                     temperature: float = 0.7, max_tokens: Optional[int] = None,
+                                     bypass_cache: bool = False) -> AsyncIterator[str]:
+        """Stream a chat completion from the specified provider."""
+        client = self.get_client(provider)
+        if not client:
+            raise ValueError(f"No client configured for provider: {provider}")
+
+        async for text in client.chat_completion_stream(messages, temperature, max_tokens, bypass_cache):
+            yield text
+
+    async def chat_completion_many(self, providers: List[str], messages: List[Dict[str, str]],
+                                   temperature: float = 0.7, max_tokens: Optional[int] = None
+                                   ) -> Dict[str, AIResponse | Exception]:
+        """Send the same chat completion to several providers concurrently.
+
+        Failures are returned in place of the response for that provider.
+        """
+        results = await asyncio.gather(
+            *(self.chat_completion(p, messages, temperature, max_tokens) for p in providers),
+            return_exceptions=True,
+        )
+        return dict(zip(providers, results))
 
     async def simple_query(self, provider: str, prompt: str,
                          temperature: float = 0.7, max_tokens: Optional[int] = None) -> str:
@@ -177,17 +363,22 @@ class AIClientManager:
 # Convenience function for synchronous usage
 def create_ai_manager_from_settings(settings_manager) -> AIClientManager:
     """Create AI manager from settings."""
-    manager = AIClientManager()
+    cache = None
+    # Opt-in: with a non-zero temperature a repeated prompt is expected to
+    # get a fresh answer, and the cache persists across restarts.
+    if settings_manager.config.getboolean("stratum", "response_cache", fallback=False):
+        cache = ResponseCache(settings_manager.path.parent / "response_cache.sqlite3")
+    manager = AIClientManager(cache)
 
     # Add OpenAI client if key exists
-    openai_key = settings_manager.config.get("openai", "api_key", fallback="")
-    openai_model = settings_manager.config.get("openai", "model", fallback="gpt-4")
+    openai_key = settings_manager.get("openai", "api_key")
+    openai_model = settings_manager.get("openai", "model", "gpt-4")
     if openai_key:
         manager.add_client("openai", openai_key, openai_model)
 
     # Add Claude client if key exists
-    claude_key = settings_manager.config.get("claude", "api_key", fallback="")
-    claude_model = settings_manager.config.get("claude", "model", fallback="claude-3-sonnet-20240229")
+    claude_key = settings_manager.get("claude", "api_key")
+    claude_model = settings_manager.get("claude", "model", "claude-3-sonnet-20240229")
     if claude_key:
         manager.add_client("claude", claude_key, claude_model)
 
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import functools
+import importlib.util
+import threading
+import wave
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .tts_engine import TTSEngine
+
+
+# Whisper weights are downloaded here once and reused on later starts.
+_MODEL_DIR = Path.home() / ".cache" / "stratum" / "whisper"
+_SAMPLE_RATE = 16000  # what Whisper expects
+# 30-second windows decoded per encoder pass by BatchedInferencePipeline.
+_BATCH_SIZE = {"cuda": 16, "cpu": 8}
+
+
+@functools.lru_cache(maxsize=1)
+def whisper_available() -> bool:
+    """Check if faster-whisper is installed, without importing it."""
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def _read_wav_16k(path: str) -> Optional[np.ndarray]:
+    """Read a 16-bit PCM WAV that is already at 16 kHz as mono float32.
+
+    Returns None for anything else, which then goes through the decoder.
+    """
+    if not path.lower().endswith(".wav"):
+        return None
+    try:
+        import numpy as np
+        with wave.open(path, "rb") as wav:
+            if wav.getframerate() != _SAMPLE_RATE or wav.getsampwidth() != 2:
+                return None
+            channels = wav.getnchannels()
+            raw = wav.readframes(wav.getnframes())
+    except (ImportError, OSError, EOFError, wave.Error):
+        return None
+
+    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def _pick_device() -> Tuple[str, str]:
+    """Return (device, compute_type) for faster-whisper."""
+    try:
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", "int8_float16"
+    except Exception:
+        pass
+    return "cpu", "int8"
+
+
+class AudioEngine:
+    """
+    Speech-to-text for the Voice tab, plus the TTS calls it makes.
+
+    Transcription uses faster-whisper (CTranslate2) with INT8 weights, which
+    is considerably faster than the PyTorch Whisper implementation and does
+    not need a GPU. Speech output is delegated to the shared TTSEngine.
+    """
+
+    def __init__(self, tts_engine: TTSEngine, model_name: str = "base") -> None:
+        self.tts = tts_engine
+        self._model_name = model_name
+        self.model = None
+        self._pipeline = None  # BatchedInferencePipeline over self.model
+        self._batch_size = _BATCH_SIZE["cpu"]
+        self._model_lock = threading.Lock()
+        # One model instance; concurrent transcriptions would just thrash it.
+        self._transcribe_lock = threading.Lock()
+
+    # ---------- speech to text ----------
+
+    def initialize_whisper(self) -> bool:
+        """Load the Whisper model. Returns False if it can't be used."""
+        with self._model_lock:
+            if self.model is not None:
+                return True
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                print("faster-whisper is not installed; transcription is disabled")
+                return False
+
+            device, compute_type = _pick_device()
+            try:
+                self.model = WhisperModel(
+                    self._model_name,
+                    device=device,
+                    compute_type=compute_type,
+                    download_root=str(_MODEL_DIR),
+                )
+            except Exception as e:
+                print(f"Whisper load error: {e}")
+                return False
+
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                # faster-whisper < 1.1; transcribe window by window instead.
+                pass
+            else:
+                self._pipeline = BatchedInferencePipeline(model=self.model)
+                self._batch_size = _BATCH_SIZE[device]
+            return True
+
+    def warmup(self) -> None:
+        """Load the model and run one second of silence through it."""
+        if not self.initialize_whisper():
+            return
+        try:
+            import numpy as np
+            # transcribe() is lazy; decoding happens while iterating.
+            with self._transcribe_lock:
+                segments, _info = self.model.transcribe(np.zeros(_SAMPLE_RATE, dtype=np.float32), beam_size=1)
+                list(segments)
+        except Exception as e:
+            print(f"Whisper warmup error: {e}")
+
+    def transcribe_file(self, file_path: str,
+                        on_progress: Optional[Callable[[str], None]] = None) -> str:
+        """Transcribe an audio or video file and return the text.
+
+        on_progress, if given, receives the text transcribed so far after
+        each segment, so long files can be shown as they are decoded.
+        """
+        path = str(file_path)
+        # WAV already at Whisper's rate needs no decode or resample.
+        samples = _read_wav_16k(path)
+        return self._transcribe(path if samples is None else samples, on_progress)
+
+    def transcribe_audio(self, samples: np.ndarray,
+                         on_progress: Optional[Callable[[str], None]] = None) -> str:
+        """Transcribe 16 kHz mono float32 samples, as returned by record_audio()."""
+        return self._transcribe(samples, on_progress)
+
+    def _transcribe(self, audio: Any, on_progress: Optional[Callable[[str], None]]) -> str:
+        if not self.initialize_whisper():
+            raise RuntimeError("Whisper model is not available")
+
+        with self._transcribe_lock:
+            if self._pipeline is not None:
+                segments, _info = self._pipeline.transcribe(
+                    audio, batch_size=self._batch_size, beam_size=1, vad_filter=True
+                )
+            else:
+                segments, _info = self.model.transcribe(audio, beam_size=1, vad_filter=True)
+
+            parts: List[str] = []
+            for segment in segments:
+                parts.append(segment.text)
+                if on_progress:
+                    on_progress("".join(parts).strip())
+            return "".join(parts).strip()
+
+    def record_audio(self, duration: float = 5) -> Optional[np.ndarray]:
+        """Record from the default microphone.
+
+        Returns 16 kHz mono float32 samples that can go straight to
+        transcribe_audio(), with no WAV file or decoder in between.
+        """
+        try:
+            import numpy as np
+            import sounddevice as sd
+        except ImportError:
+            print("sounddevice is not installed; recording is disabled")
+            return None
+
+        # Filled from PortAudio's callback thread while recording.
+        blocks: deque = deque()
+
+        def on_block(indata, frames, time_info, status) -> None:
+            blocks.append(indata[:, 0].copy())
+
+        try:
+            with sd.InputStream(samplerate=_SAMPLE_RATE, channels=1, dtype="float32",
+                                callback=on_block):
+                sd.sleep(int(duration * 1000))
+        except Exception as e:
+            print(f"Recording error: {e}")
+            return None
+        return np.concatenate(blocks) if blocks else None
+
+    # ---------- text to speech ----------
+
+    def set_voice(self, voice_name: str) -> None:
+        self.tts.set_voice(voice_name)
+
+    def speak(self, text: str) -> bool:
+        """Speak text, blocking until playback ends."""
+        return self.tts.speak_text(text, block=True)
+
+    def save_to_file(self, text: str, file_path: str) -> bool:
+        """Write the spoken text to an MP3 file instead of playing it."""
+        return self.tts.save_to_file(text, file_path)
+
+
+# ---------- shared instance ----------
+
+_engine: Optional[AudioEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_audio_engine(tts_engine: TTSEngine) -> AudioEngine:
+    """Return the process-wide AudioEngine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine(tts_engine)
+        return _engine
+
+
+def warmup(tts_engine: TTSEngine) -> AudioEngine:
+    """Start loading Whisper in the background so the Voice tab opens ready.
+
+    A tab that asks for the model while this is still running waits on the
+    same lock instead of loading it a second time.
+    """
+    engine = get_audio_engine(tts_engine)
+    if whisper_available() and engine.model is None:
+        threading.Thread(target=engine.warmup, name="whisper-warmup", daemon=True).start()
+    return engine
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
-import json
+from typing import Callable, Dict, Iterator, List, Optional
+import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    import json
 
-@dataclass
+
+@dataclass(slots=True)
 class Command:
     id: str
     label: str
@@ -17,18 +24,21 @@ class Command:
 
 
 class CommandRegistry:
-    def __init__(self, commands_path: Path) -> None:
+    def __init__(self, commands_path: Path, fsync: bool = False) -> None:
         self._path = Path(commands_path)
+        self._fsync = fsync
         self._commands: Dict[str, Command] = {}
         self._handlers: Dict[str, Callable[..., None]] = {}
+        self._dirty = False
+        self._batch_depth = 0
 
     # ---------- loading ----------
 
     def load(self) -> None:
         if not self._path.exists():
             self._path.write_text("[]", encoding="utf-8")
-        raw = self._path.read_text(encoding="utf-8").strip() or "[]"
-        data = json.loads(raw)
+        raw = self._path.read_bytes().strip() or b"[]"
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         self._commands.clear()
         for item in data:
             cmd = Command(
@@ -41,6 +51,65 @@ class CommandRegistry:
             )
             self._commands[cmd.id] = cmd
 
+    # ---------- persist ----------
+
+    def save(self) -> None:
+        if self._batch_depth:
+            # Deferred until the outermost batch() exits.
+            self._dirty = True
+            return
+
+        data = [
+            {
+                "id": cmd.id,
+                "label": cmd.label,
+                "action": cmd.action,
+                "hotkey": cmd.hotkey,
+                "hotstring": cmd.hotstring,
+                "tags": cmd.tags or [],
+            }
+            for cmd in self._commands.values()
+        ]
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        self._write_atomic(payload)
+        self._dirty = False
+
+    def _write_atomic(self, payload: bytes) -> None:
+        # Write a sibling temp file and rename it over commands.json so a
+        # crash mid-write never leaves a truncated file behind.
+        tmp = self._path.with_suffix(".json.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write() may write less than asked; keep going until done.
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if self._fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self._path)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several mutations into a single write of commands.json:
+
+            with registry.batch():
+                for cmd in imported:
+                    registry.add_command(cmd)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save()
+
     # ---------- query ----------
 
     def all(self) -> List[Command]:
@@ -49,6 +118,34 @@ class CommandRegistry:
     def get(self, command_id: str) -> Optional[Command]:
         return self._commands.get(command_id)
 
+    # ---------- mutation ----------
+
+    def add_command(self, cmd: Command) -> None:
+        self._commands[cmd.id] = cmd
+        self.save()
+
+    def update_command(self, command_id: str, **fields) -> bool:
+        cmd = self._commands.get(command_id)
+        if not cmd:
+            return False
+
+        changed = False
+        for name, value in fields.items():
+            if value is not None and hasattr(cmd, name) and getattr(cmd, name) != value:
+                setattr(cmd, name, value)
+                changed = True
+
+        # Re-applying the same values is still a successful update.
+        if changed:
+            self.save()
+        return True
+
+    def remove_command(self, command_id: str) -> bool:
+        if self._commands.pop(command_id, None) is None:
+            return False
+        self.save()
+        return True
+
     # ---------- handlers / execution ----------
 
     def register_handler(self, action_id: str, func: Callable[..., None]) -> None:
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
-import keyboard
-
 from .command_registry import CommandRegistry
 
 
@@ -11,16 +10,21 @@ def register_hotkeys(registry: CommandRegistry) -> None:
     """
     Register all hotkeys defined in commands.json with the keyboard library.
     """
-    for cmd in registry.all():
-        if not cmd.hotkey:
-            continue
+    # One binding per key combination; a later command wins a duplicate.
+    hotkey_map = {cmd.hotkey: cmd.id for cmd in registry.all() if cmd.hotkey}
+    if not hotkey_map:
+        return
+
+    import keyboard
 
-        # Capture cmd.id by value in default arg
-        keyboard.add_hotkey(cmd.hotkey, lambda cid=cmd.id: registry.execute(cid))
+    for hotkey, command_id in hotkey_map.items():
+        # partial is C-level: no extra Python frame per key press.
+        keyboard.add_hotkey(hotkey, partial(registry.execute, command_id))
 
 
 def unregister_all_hotkeys() -> None:
     try:
+        import keyboard
         keyboard.unhook_all_hotkeys()
     except Exception:
         # Be tolerant if nothing is registered yet.
@@ -1,25 +1,200 @@
 from __future__ import annotations
 
-from typing import Callable
+import queue
+import sys
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple
 
 from .command_registry import CommandRegistry
 
 
+# Marks a trie node that completes a trigger; value is (trigger, command id).
+_END = "\0"
+
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _VK_BACK = 0x08
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", wintypes.WPARAM),
+        ]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        # Only here so the union has the size SendInput expects.
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", wintypes.WPARAM),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    def _send_backspaces(count: int) -> None:
+        """Queue every backspace down/up pair with a single SendInput call."""
+        events = (_INPUT * (count * 2))()
+        for i, ev in enumerate(events):
+            ev.type = _INPUT_KEYBOARD
+            ev.u.ki.wVk = _VK_BACK
+            ev.u.ki.dwFlags = _KEYEVENTF_KEYUP if i % 2 else 0
+        sent = ctypes.windll.user32.SendInput(len(events), events, ctypes.sizeof(_INPUT))
+        if sent != len(events):
+            raise ctypes.WinError()
+else:
+    def _send_backspaces(count: int) -> None:
+        """Send count backspaces as one multi-step keyboard.send call."""
+        import keyboard
+        keyboard.send(", ".join(["backspace"] * count))
+
+
 class HotstringEngine:
     """
-    Placeholder / skeleton for your future hotstring system.
-    This will eventually mirror your old hotstrings backend,
-    but driven by CommandRegistry.
+    Watches typed keys and fires a command when the text just typed ends
+    with one of the hotstrings defined in commands.json.
+
+    Triggers are stored reversed in a trie, so a match check walks backwards
+    from the last typed character and touches at most len(longest trigger)
+    nodes, no matter how many hotstrings are registered.
     """
 
     def __init__(self, registry: CommandRegistry) -> None:
         self._registry = registry
+        self._hotstrings: Dict[str, str] = {}
+        self._trie: dict = {}
+        self._last_chars: frozenset[str] = frozenset()
+        self._buffer: deque[str] = deque(maxlen=1)
+        self._hook = None
+        self._queue: queue.SimpleQueue[Tuple[str, str]] = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        # Keys that edit the buffer rather than add a character to it.
+        self._dispatch = {
+            "space": self._buffer_reset,
+            "enter": self._buffer_reset,
+            "tab": self._buffer_reset,
+            "escape": self._buffer_reset,
+            "backspace": self._on_backspace,
+        }
 
     def register_all(self) -> None:
-        # TODO: integrate your real hotstring engine here.
-        # For now, this is a no-op so Stratum still runs.
+        self._hotstrings.clear()
         for cmd in self._registry.all():
             if cmd.hotstring:
-                # later: register with your hotstring library and
-                # call self._registry.execute(cmd.id) when triggered.
+                self._hotstrings[cmd.hotstring.lower()] = cmd.id
+
+        self._trie = self._build_trie(self._hotstrings)
+        # The trie root is keyed by each trigger's last character.
+        self._last_chars = frozenset(self._trie)
+        # Nothing older than the longest trigger can ever be part of a match.
+        self._buffer = deque(maxlen=max(map(len, self._hotstrings), default=1))
+
+        if self._hotstrings:
+            self._install_hook()
+        else:
+            self.unregister_all()
+
+    def unregister_all(self) -> None:
+        if self._hook is not None:
+            try:
+                import keyboard
+                keyboard.unhook(self._hook)
+            except Exception:
                 pass
+            self._hook = None
+
+    # ---------- matching ----------
+
+    @staticmethod
+    def _build_trie(hotstrings: Dict[str, str]) -> dict:
+        root: dict = {}
+        for trigger, cmd_id in hotstrings.items():
+            node = root
+            for ch in reversed(trigger):
+                node = node.setdefault(ch, {})
+            node[_END] = (trigger, cmd_id)
+        return root
+
+    def _match(self) -> Optional[Tuple[str, str]]:
+        # Keep walking past shorter hits so the longest trigger wins
+        # ("/code" over "code" when both are registered).
+        node = self._trie
+        match = None
+        for ch in reversed(self._buffer):
+            node = node.get(ch)
+            if node is None:
+                break
+            match = node.get(_END, match)
+        return match
+
+    # ---------- keyboard hook ----------
+
+    def _install_hook(self) -> None:
+        if self._hook is None:
+            # Deferred so the keyboard hook library only loads when hotstrings exist.
+            import keyboard
+            self._hook = keyboard.on_press(self._on_key_press)
+
+        if self._worker is None:
+            # Keys can't be sent from inside the hook callback; one long-lived
+            # worker replays triggers in the order they were typed.
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+
+    def _on_key_press(self, event) -> None:
+        key_name = event.name or ""
+        handler = self._dispatch.get(key_name)
+        if handler:
+            handler()
+        elif len(key_name) == 1:
+            self._append_char(key_name.lower())
+
+    def _append_char(self, ch: str) -> None:
+        # deque(maxlen=...) drops the oldest char itself.
+        self._buffer.append(ch)
+        # Only a key that ends some trigger can complete a match.
+        if ch in self._last_chars:
+            self._check_and_trigger()
+
+    def _buffer_reset(self) -> None:
+        self._buffer.clear()
+
+    def _on_backspace(self) -> None:
+        if self._buffer:
+            self._buffer.pop()
+
+    def _check_and_trigger(self) -> None:
+        match = self._match()
+        if not match:
+            return
+
+        trigger, cmd_id = match
+        self._buffer.clear()
+        self._queue.put((cmd_id, trigger))
+
+    def _run_worker(self) -> None:
+        while True:
+            self._execute_hotstring(*self._queue.get())
+
+    def _execute_hotstring(self, cmd_id: str, trigger: str) -> None:
+        try:
+            # Erase the typed trigger, then run the command in its place.
+            _send_backspaces(len(trigger))
+            self._registry.execute(cmd_id)
+        except Exception as e:
+            print(f"Hotstring error ({trigger}): {e}")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    import json
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+class ResponseCache:
+    """
+    Exact-match cache of AI responses backed by a SQLite file.
+
+    Keys are a SHA-256 of everything that determines the request
+    (provider, model, messages, temperature, max_tokens), so a repeated
+    prompt is answered from disk without calling the API.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._path = Path(db_path)
+        self._lock = threading.Lock()
+        # AI calls come from worker threads; access is serialised by _lock.
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response BLOB NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, messages: List[Dict[str, str]],
+                 temperature: float, max_tokens: Optional[int]) -> str:
+        payload = {
+            "p": provider,
+            "model": model,
+            "msgs": messages,
+            "t": temperature,
+            "mt": max_tokens,
+        }
+        return hashlib.sha256(_dumps(payload)).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return _loads(row[0]) if row else None
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, _dumps(data), time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import os
 from configparser import ConfigParser
 from pathlib import Path
+from typing import Dict, Iterable
 
 
 class SettingsManager:
     def __init__(self, ini_path: Path) -> None:
         self._path = Path(ini_path)
         self._config = ConfigParser()
+        self._sections: Dict[str, Dict[str, str]] = {}
+        # Section -> "a non-blank api_key is set"; dropped whenever keys change.
+        self._has_key: Dict[str, bool] = {}
+        # Set by every setter; cleared once the change is on disk.
+        self._dirty = False
 
     # ---------- load / init ----------
 
@@ -15,6 +22,12 @@ class SettingsManager:
         if not self._path.exists():
             self._create_default()
         self._config.read(self._path, encoding="utf-8")
+        self._refresh_sections()
+
+    def _refresh_sections(self) -> None:
+        # Plain-dict snapshot so hot lookups skip ConfigParser interpolation.
+        self._sections = {s: dict(self._config.items(s)) for s in self._config.sections()}
+        self._has_key.clear()
 
     def _create_default(self) -> None:
         self._config["openai"] = {"api_key": "", "model": "gpt-4.1"}
@@ -27,8 +40,18 @@ class SettingsManager:
     # ---------- persist ----------
 
     def save(self) -> None:
-        with self._path.open("w", encoding="utf-8") as f:
+        # Write a temp file and swap it in, so a crash mid-write can't
+        # leave a truncated settings.ini behind.
+        tmp = self._path.with_suffix(".ini.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
             self._config.write(f)
+        os.replace(tmp, self._path)
+        self._dirty = False
+        self._refresh_sections()
+
+    def save_if_dirty(self) -> None:
+        if self._dirty:
+            self.save()
 
     # ---------- convenience helpers ----------
 
@@ -36,13 +59,34 @@ class SettingsManager:
     def config(self) -> ConfigParser:
         return self._config
 
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, section: str, key: str, default: str = "") -> str:
+        return self._sections.get(section, {}).get(key, default)
+
     def get_api_key(self, section: str) -> str:
-        return self._config.get(section, "api_key", fallback="")
+        return self.get(section, "api_key")
 
     def set_api_key(self, section: str, value: str) -> None:
         if section not in self._config:
             self._config[section] = {}
         self._config[section]["api_key"] = value
+        self._sections.setdefault(section, {})["api_key"] = value
+        self._has_key.pop(section, None)
+        self._dirty = True
+
+    def has_api_key(self, section: str) -> bool:
+        """Whether a key is configured, without handing the key itself out."""
+        has = self._has_key.get(section)
+        if has is None:
+            has = self._has_key[section] = bool(self.get_api_key(section).strip())
+        return has
+
+    def has_any_key(self, sections: Iterable[str] = ("openai", "claude")) -> bool:
+        # Stops at the first provider with a key configured.
+        return any(self.has_api_key(s) for s in sections)
 
     def is_first_run(self) -> bool:
         # "first run" = no OpenAI key at all
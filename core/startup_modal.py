@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QFrame, QScrollArea, QWidget, QMessageBox
+    QPushButton, QScrollArea, QWidget, QMessageBox
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPixmap, QIcon
@@ -13,33 +13,60 @@ if TYPE_CHECKING:
     from .settings_manager import SettingsManager
 
 
+_ICON: Optional[QIcon] = None
+
+
+def get_app_icon() -> QIcon:
+    """Stratum window icon, read from disk the first time it is needed."""
+    global _ICON
+    if _ICON is None:
+        _ICON = QIcon("assets/stratum.ico")
+    return _ICON
+
+
 class APIKeyDialog(QDialog):
     """First-run dialog for API key setup."""
 
+    # Parsed once for the whole dialog; children pick rules up by objectName.
+    _STYLESHEET = """
+        QLabel#description { color: #666; }
+        QLabel#modelInfo { color: #666; font-size: 11px; margin-bottom: 5px; }
+        QLabel#footer { color: #888; font-size: 10px; }
+        QWidget#hline { background-color: #c8c8c8; }
+    """
+
+    # Shared by every provider label; created on first use (needs a QApplication).
+    _BOLD_FONT: Optional[QFont] = None
+
     def __init__(self, settings_manager: SettingsManager, parent=None) -> None:
         super().__init__(parent)
         self.settings = settings_manager
         self.api_keys: Dict[str, str] = {}
+        self._key_inputs: Dict[str, QLineEdit] = {}
 
         self.setWindowTitle("Welcome to Stratum - API Setup")
         self.setModal(True)
         self.setFixedWidth(500)
         self.resize(500, 600)
 
-        # Set window icon if available
-        try:
-            self.setWindowIcon(QIcon("assets/stratum.ico"))
-        except:
-            pass
+        self.setWindowIcon(get_app_icon())
 
-        self._setup_ui()
-        self._load_existing_keys()
+        # Widgets are built on first show; see showEvent().
+        self._ui_built = False
+
+    def showEvent(self, event) -> None:
+        if not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+            self._load_existing_keys()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup the user interface."""
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
+        self.setStyleSheet(self._STYLESHEET)
 
         # Header
         header_label = QLabel("Welcome to Stratum!")
@@ -59,24 +86,16 @@ class APIKeyDialog(QDialog):
             "Leave fields blank for providers you don't want to use."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666;")
+        desc_label.setObjectName("description")
         layout.addWidget(desc_label)
 
-        # Separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        layout.addWidget(separator)
+        layout.addWidget(self._make_hline())
 
         # API Key inputs
         self._add_api_key_input(layout, "OpenAI", "openai", "GPT-4, GPT-3.5")
         self._add_api_key_input(layout, "Claude (Anthropic)", "claude", "Claude 3, Claude 2")
 
-        # Separator
-        separator2 = QFrame()
-        separator2.setFrameShape(QFrame.HLine)
-        separator2.setFrameShadow(QFrame.Sunken)
-        layout.addWidget(separator2)
+        layout.addWidget(self._make_hline())
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -98,34 +117,51 @@ class APIKeyDialog(QDialog):
             "Stratum will work with any combination of API keys."
         )
         footer_label.setWordWrap(True)
-        footer_label.setStyleSheet("color: #888; font-size: 10px;")
+        footer_label.setObjectName("footer")
         footer_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(footer_label)
 
+    @classmethod
+    def _bold_font(cls) -> QFont:
+        if cls._BOLD_FONT is None:
+            cls._BOLD_FONT = QFont()
+            cls._BOLD_FONT.setBold(True)
+        return cls._BOLD_FONT
+
+    @staticmethod
+    def _make_hline() -> QWidget:
+        """1px separator line, coloured by the dialog stylesheet."""
+        line = QWidget()
+        line.setObjectName("hline")
+        line.setFixedHeight(1)
+        return line
+
     def _add_api_key_input(self, parent_layout: QVBoxLayout, provider_name: str,
                           config_key: str, models: str) -> None:
         """Add an API key input section."""
         # Provider header
         provider_label = QLabel(f"{provider_name} API Key")
-        provider_font = QFont()
-        provider_font.setBold(True)
-        provider_label.setFont(provider_font)
+        provider_label.setFont(self._bold_font())
         parent_layout.addWidget(provider_label)
 
         # Model info
         model_label = QLabel(f"Models: {models}")
-        model_label.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 5px;")
+        model_label.setObjectName("modelInfo")
         parent_layout.addWidget(model_label)
 
         # Input field
         key_input = QLineEdit()
         key_input.setPlaceholderText(f"Enter your {provider_name} API key...")
         key_input.setEchoMode(QLineEdit.Password)  # Hide the key
-        key_input.textChanged.connect(lambda text, key=config_key: self._on_key_changed(key, text))
+        # Only the committed value matters, not every keystroke.
+        key_input.editingFinished.connect(
+            lambda ki=key_input, key=config_key: self._on_key_changed(key, ki.text())
+        )
         parent_layout.addWidget(key_input)
 
         # Store reference
         setattr(self, f"{config_key}_input", key_input)
+        self._key_inputs[config_key] = key_input
 
         # Spacer
         parent_layout.addSpacing(10)
@@ -137,8 +173,8 @@ class APIKeyDialog(QDialog):
     def _load_existing_keys(self) -> None:
         """Load any existing API keys."""
         try:
-            openai_key = self.settings.config.get("openai", "api_key", fallback="")
-            claude_key = self.settings.config.get("claude", "api_key", fallback="")
+            openai_key = self.settings.get_api_key("openai")
+            claude_key = self.settings.get_api_key("claude")
 
             if openai_key:
                 self.api_keys["openai"] = openai_key
@@ -153,16 +189,17 @@ class APIKeyDialog(QDialog):
     def _save_and_continue(self) -> None:
         """Save the API keys and close the dialog."""
         try:
+            # Pick up a field still being edited (Enter pressed, focus never left)
+            for provider, key_input in self._key_inputs.items():
+                self._on_key_changed(provider, key_input.text())
+
             # Update settings
             for provider, key in self.api_keys.items():
                 if key.strip():  # Only save non-empty keys
-                    if not self.settings.config.has_section(provider):
-                        self.settings.config.add_section(provider)
-                    self.settings.config.set(provider, "api_key", key.strip())
+                    self.settings.set_api_key(provider, key.strip())
 
-            # Save to file
-            with open(self.settings._path, 'w', encoding='utf-8') as f:
-                self.settings.config.write(f)
+            # Save to file (also refreshes the cached settings snapshot)
+            self.settings.save()
 
             self.accept()
 
@@ -190,13 +227,9 @@ class APIKeyDialog(QDialog):
     @staticmethod
     def show_if_needed(settings_manager: SettingsManager, parent=None) -> bool:
         """Show the dialog if API keys are missing. Returns True if user completed setup."""
-        # Check if we have any API keys
-        has_openai = bool(settings_manager.config.get("openai", "api_key", fallback="").strip())
-        has_claude = bool(settings_manager.config.get("claude", "api_key", fallback="").strip())
-
-        if not has_openai and not has_claude:
-            dialog = APIKeyDialog(settings_manager, parent)
-            result = dialog.exec()
-            return result == QDialog.Accepted
+        if settings_manager.has_any_key():
+            return True  # Keys already exist
 
-        return True  # Keys already exist
+        dialog = APIKeyDialog(settings_manager, parent)
+        result = dialog.exec()
+        return result == QDialog.Accepted
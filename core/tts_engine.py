@@ -1,38 +1,279 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import importlib.util
 import io
+import os
 import platform
+import re
+import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import threading
 import time
 
 
+# SpeechVoiceSpeakFlags / SpeechRunState values from the SAPI type library.
+_SVSF_ASYNC = 1
+_SVSF_PURGE_BEFORE_SPEAK = 2
+_SRSE_IS_SPEAKING = 2
+
+# Text for the PowerShell SAPI fallback goes in a single-quoted literal, where
+# nothing is expanded and the only escape is doubling the quote. PowerShell
+# also treats the typographic single quotes as quote characters.
+_PS_SINGLE_QUOTE_ESCAPE = str.maketrans(
+    {q: q * 2 for q in ("'", "\u2018", "\u2019", "\u201a", "\u201b")}
+)
+
+
+_TTS_CACHE_DIR = Path.home() / ".cache" / "stratum" / "tts"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Edge TTS returns 24 kHz mono MP3. Decoding straight to that format and
+# opening the device with it means no per-frame resampling or upmixing.
+_PLAYBACK_RATE = 24000
+_PLAYBACK_CHANNELS = 1
+# Device buffer in ms. Larger values trade start latency for fewer dropouts
+# when the CPU is busy (e.g. with Whisper); tune via the environment.
+_PLAYBACK_BUFFER_MS = _env_int("STRATUM_PLAYBACK_BUFFER_MS", 200)
+
+# Long text is spoken in groups of whole sentences of about this many
+# characters; the next group is synthesized while the current one plays.
+_STREAM_CHUNK_CHARS = 300
+_STREAM_PREFETCH = 2
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Size cap for the on-disk TTS cache; least recently used files go first.
+_TTS_CACHE_MAX_BYTES = _env_int("STRATUM_TTS_CACHE_MB", 200) * 1024 * 1024
+
+
+def _split_for_streaming(text: str) -> List[str]:
+    """Group whole sentences into chunks of roughly _STREAM_CHUNK_CHARS."""
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if current and len(current) + len(sentence) >= _STREAM_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _temp_audio_path() -> str:
+    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
+        return temp_file.name
+
+
+# The probes below only depend on what is installed, so each runs at most
+# once per process no matter how many TTSEngine instances are created.
+
+@functools.lru_cache(maxsize=1)
+def _has_edge_tts_module() -> bool:
+    """Check if the edge_tts package can be used in-process."""
+    return importlib.util.find_spec("edge_tts") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _has_comtypes() -> bool:
+    """Check if SAPI can be driven directly over COM."""
+    return platform.system() == "Windows" and importlib.util.find_spec("comtypes") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _has_miniaudio() -> bool:
+    """Check if audio files can be decoded and played in-process."""
+    return importlib.util.find_spec("miniaudio") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _check_edge_tts() -> bool:
+    """Check if Edge TTS is available."""
+    # A PATH lookup answers the same question as running `edge-tts --help`
+    # without booting another interpreter.
+    return _has_edge_tts_module() or shutil.which("edge-tts") is not None
+
+
+# Filled by the first listing that returns voices. Failures (offline, slow
+# start) aren't remembered, so a later call tries again.
+_edge_voices: tuple[Dict[str, str], ...] = ()
+
+
+def _list_edge_voices() -> tuple[Dict[str, str], ...]:
+    """List Edge TTS voices."""
+    global _edge_voices
+    if not _edge_voices:
+        _edge_voices = _fetch_edge_voices()
+    return _edge_voices
+
+
+def _fetch_edge_voices() -> tuple[Dict[str, str], ...]:
+    if _has_edge_tts_module():
+        try:
+            import edge_tts
+            return tuple(
+                {
+                    "name": v["ShortName"],
+                    "language": v["Locale"],
+                    "gender": v["Gender"],
+                    "description": v.get("FriendlyName", ""),
+                }
+                for v in asyncio.run(edge_tts.list_voices())
+            )
+        except Exception:
+            return ()
+
+    try:
+        result = subprocess.run(
+            ["edge-tts", "--list-voices"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode == 0:
+            voices = []
+            lines = result.stdout.strip().split('\n')
+            for line in lines[1:]:  # Skip header
+                if line.strip():
+                    parts = line.split()
+                    if len(parts) >= 4:
+                        voices.append({
+                            "name": parts[0],
+                            "language": parts[1],
+                            "gender": parts[2],
+                            "description": " ".join(parts[3:])
+                        })
+            return tuple(voices)
+    except Exception:
+        pass
+    return ()
+
+
+class TTSCache:
+    """
+    Synthesized Edge TTS audio on disk, one MP3 file per phrase.
+
+    Keys are a SHA-256 of the voice settings and text, so speaking a phrase
+    again, or saving text that was just spoken, reads the audio back instead
+    of making another network request.
+    """
+
+    def __init__(self, cache_dir: Path = _TTS_CACHE_DIR,
+                 max_bytes: int = _TTS_CACHE_MAX_BYTES) -> None:
+        self._dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._size: Optional[int] = None  # bytes on disk, counted on first put
+        # Prefetch workers put concurrently.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(voice: str, rate: str, volume: str, text: str) -> str:
+        return hashlib.sha256(f"{voice}|{rate}|{volume}|{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.mp3"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            # mtime doubles as last use, so eviction keeps what is replayed.
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp name: two workers may put the same key at once.
+            fd, tmp_name = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                # Readers never see a partly written file.
+                os.replace(tmp_name, path)
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            print(f"TTS cache write error: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f.stat().st_size for f in self._dir.glob("*.mp3"))
+            else:
+                self._size += len(data)
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache is at 90% of its cap."""
+        entries = []
+        for f in self._dir.glob("*.mp3"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, f))
+        entries.sort()
+
+        size = sum(e[1] for e in entries)
+        target = self._max_bytes * 9 // 10
+        for _mtime, file_size, f in entries:
+            if size <= target:
+                break
+            try:
+                f.unlink()
+            except OSError:
+                continue
+            size -= file_size
+        self._size = size
+
+
 class TTSEngine:
     """Unified text-to-speech engine with Edge TTS primary and SAPI fallback."""
 
     def __init__(self):
-        self._edge_available = self._check_edge_tts()
+        self._edge_available = _check_edge_tts()
         self._current_process: Optional[subprocess.Popen] = None
         self._voice = "en-US-AriaNeural"  # Default Edge TTS voice
         self._rate = "+0%"  # Speech rate
         self._volume = "+0%"  # Speech volume
+        self._stop_requested = threading.Event()
+        self._sapi = None  # SAPI.SpVoice COM object, created on first use
+        # COM objects may only be used from the (CoInitialize'd) thread that
+        # created them, so every SAPI call goes through this one thread.
+        self._sapi_executor: Optional[ThreadPoolExecutor] = None
+        self._sapi_lock = threading.Lock()
+        self._playback = None  # miniaudio.PlaybackDevice while a file is playing
+        # Set for the whole synthesize-and-play run; is_speaking() just reads it.
+        self._speaking = threading.Event()
+        self._cache = TTSCache()
 
-    def _check_edge_tts(self) -> bool:
-        """Check if Edge TTS is available."""
-        try:
-            result = subprocess.run(
-                ["edge-tts", "--help"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            return False
+    def warmup(self) -> None:
+        """Enumerate voices in the background so the first lookup is cached."""
+        threading.Thread(target=self.get_available_voices, name="tts-warmup", daemon=True).start()
 
     def get_available_voices(self) -> List[Dict[str, str]]:
         """Get list of available voices."""
@@ -43,30 +284,7 @@ class TTSEngine:
 
     def _get_edge_voices(self) -> List[Dict[str, str]]:
         """Get Edge TTS voices."""
-        try:
-            result = subprocess.run(
-                ["edge-tts", "--list-voices"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                voices = []
-                lines = result.stdout.strip().split('\n')
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            voices.append({
-                                "name": parts[0],
-                                "language": parts[1],
-                                "gender": parts[2],
-                                "description": " ".join(parts[3:])
-                            })
-                return voices
-        except Exception:
-            pass
-        return []
+        return list(_list_edge_voices())
 
     def _get_sapi_voices(self) -> List[Dict[str, str]]:
         """Get Windows SAPI voices (fallback)."""
@@ -89,68 +307,223 @@ class TTSEngine:
         """Set speech volume (e.g., '+20%', '-10%')."""
         self._volume = volume
 
-    def speak_text(self, text: str, block: bool = False) -> None:
-        """Speak text using available TTS engine."""
+    def speak_text(self, text: str, block: bool = False) -> bool:
+        """Speak text using available TTS engine.
+
+        Returns False if speech failed; non-blocking calls only report
+        whether speech could be started.
+        """
         if not text.strip():
-            return
+            return False
 
         if self._edge_available:
-            self._speak_edge(text, block)
-        else:
-            self._speak_sapi(text, block)
+            return self._speak_edge(text, block)
+        return self._speak_sapi(text, block)
+
+    def save_to_file(self, text: str, file_path: str) -> bool:
+        """Synthesize text into an MP3 file at file_path without playing it."""
+        if not text.strip() or not self._edge_available:
+            return False
+
+        self._stop_requested.clear()
+        try:
+            # Split the same way as speech so audio that was just spoken is
+            # read back from the cache; MP3 frames concatenate cleanly.
+            with ThreadPoolExecutor(max_workers=_STREAM_PREFETCH) as pool, \
+                    open(file_path, "wb") as out:
+                for data in pool.map(self._edge_audio, self._edge_chunks(text)):
+                    if data is None:
+                        return False
+                    out.write(data)
+            return True
+        except Exception as e:
+            print(f"Edge TTS error: {e}")
+            return False
 
-    def _speak_edge(self, text: str, block: bool) -> None:
+    def _speak_edge(self, text: str, block: bool) -> bool:
         """Speak text using Edge TTS."""
-        def run_tts():
+        def run_tts() -> bool:
             try:
-                # Create temporary file for audio output
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                    temp_path = temp_file.name
-
-                # Build Edge TTS command
-                cmd = [
-                    "edge-tts",
-                    "--text", text,
-                    "--voice", self._voice,
-                    "--rate", self._rate,
-                    "--volume", self._volume,
-                    "--write-media", temp_path
-                ]
-
-                # Run Edge TTS
-                self._current_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
+                chunks = self._edge_chunks(text)
+                if len(chunks) > 1:
+                    return self._speak_edge_chunks(chunks)
 
-                # Wait for completion if blocking
-                if block:
-                    self._current_process.wait()
-
-                    # Play the generated audio file
-                    self._play_audio_file(temp_path)
+                # Create temporary file for audio output
+                temp_path = _temp_audio_path()
+                completed = self._write_edge_audio(chunks[0], temp_path)
 
-                    # Clean up temp file
-                    try:
-                        Path(temp_path).unlink(missing_ok=True)
-                    except Exception:
-                        pass
+                # An external player opens the file asynchronously, so it is
+                # only removed once playback has finished in-process.
+                if not completed or self._play_audio_file(temp_path):
+                    Path(temp_path).unlink(missing_ok=True)
+                return completed
 
             except Exception as e:
                 print(f"Edge TTS error: {e}")
+                return False
             finally:
-                self._current_process = None
+                self._speaking.clear()
 
+        self._stop_requested.clear()
+        self._speaking.set()
         if block:
-            run_tts()
-        else:
-            thread = threading.Thread(target=run_tts, daemon=True)
-            thread.start()
+            return run_tts()
+        thread = threading.Thread(target=run_tts, daemon=True)
+        thread.start()
+        return True
+
+    @staticmethod
+    def _edge_chunks(text: str) -> List[str]:
+        """Split text the way it will be synthesized and cached."""
+        # Chunked playback needs both in-process synthesis and playback.
+        if _has_edge_tts_module() and _has_miniaudio():
+            return _split_for_streaming(text)
+        return [text]
+
+    def _edge_audio(self, text: str) -> Optional[bytes]:
+        """MP3 audio for text, from the cache or a new Edge TTS request.
+
+        Returns None if synthesis failed or stop_speaking() interrupted it.
+        """
+        key = TTSCache.make_key(self._voice, self._rate, self._volume, text)
+        data = self._cache.get(key)
+        if data is not None:
+            return data
+
+        temp_path = _temp_audio_path()
+        try:
+            if _has_edge_tts_module():
+                completed = self._synthesize_edge(text, temp_path)
+            else:
+                completed = self._synthesize_edge_cli(text, temp_path)
+            if not completed:
+                return None
+            data = Path(temp_path).read_bytes()
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+        self._cache.put(key, data)
+        return data
+
+    def _write_edge_audio(self, text: str, file_path: str) -> bool:
+        data = self._edge_audio(text)
+        if data is None:
+            return False
+        Path(file_path).write_bytes(data)
+        return True
+
+    def _speak_edge_chunks(self, chunks: List[str]) -> bool:
+        """Play chunks in order while the following ones are synthesized.
+
+        The first audio starts after one short request instead of after the
+        whole text has been downloaded.
+        """
+        paths: List[str] = []
+        queued: deque = deque()
+        pending = iter(chunks)
+        completed = True
+
+        try:
+            with ThreadPoolExecutor(max_workers=_STREAM_PREFETCH) as pool:
+                def submit_next() -> None:
+                    chunk = next(pending, None)
+                    if chunk is not None:
+                        path = _temp_audio_path()
+                        paths.append(path)
+                        queued.append((path, pool.submit(self._write_edge_audio, chunk, path)))
+
+                for _ in range(_STREAM_PREFETCH):
+                    submit_next()
+                while queued:
+                    path, future = queued.popleft()
+                    if not future.result() or self._stop_requested.is_set():
+                        completed = False
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                    submit_next()
+                    self._play_miniaudio(path)
+        finally:
+            for path in paths:
+                Path(path).unlink(missing_ok=True)
+        return completed
 
-    def _speak_sapi(self, text: str, block: bool) -> None:
+    def _synthesize_edge(self, text: str, file_path: str) -> bool:
+        """Stream Edge TTS audio into file_path in-process.
+
+        Returns False if stop_speaking() interrupted the synthesis.
+        """
+        import edge_tts
+
+        async def synthesize() -> bool:
+            communicate = edge_tts.Communicate(text, self._voice, rate=self._rate, volume=self._volume)
+            with open(file_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if self._stop_requested.is_set():
+                        return False
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
+            return True
+
+        return asyncio.run(synthesize())
+
+    def _synthesize_edge_cli(self, text: str, file_path: str) -> bool:
+        """Write Edge TTS audio to file_path via the edge-tts command line tool."""
+        cmd = [
+            "edge-tts",
+            "--text", text,
+            "--voice", self._voice,
+            "--rate", self._rate,
+            "--volume", self._volume,
+            "--write-media", file_path
+        ]
+
+        try:
+            self._current_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            return self._current_process.wait() == 0
+        finally:
+            self._current_process = None
+
+    def _speak_sapi(self, text: str, block: bool) -> bool:
         """Speak text using Windows SAPI (fallback)."""
-        def run_sapi():
+        if not _has_comtypes():
+            return self._speak_sapi_powershell(text, block)
+        try:
+            # SAPI plays async speech on its own audio thread; the COM thread
+            # is only busy for the call itself.
+            self._sapi_run(lambda voice: voice.Speak(text, _SVSF_ASYNC))
+            if block:
+                # Wait in short slices so stop_speaking() can get onto the
+                # COM thread and purge the speech in between.
+                while not self._sapi_run(lambda voice: voice.WaitUntilDone(100)):
+                    pass
+            return True
+        except Exception as e:
+            print(f"SAPI TTS error: {e}")
+            return False
+
+    def _sapi_run(self, fn):
+        """Run fn(voice) on the SAPI COM thread and return its result."""
+        with self._sapi_lock:
+            if self._sapi_executor is None:
+                import comtypes
+                self._sapi_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="sapi", initializer=comtypes.CoInitialize
+                )
+        return self._sapi_executor.submit(lambda: fn(self._get_sapi_voice())).result()
+
+    def _get_sapi_voice(self):
+        """Create the SAPI voice once, on the COM thread; later calls reuse it."""
+        if self._sapi is None:
+            import comtypes.client
+            self._sapi = comtypes.client.CreateObject("SAPI.SpVoice")
+        return self._sapi
+
+    def _speak_sapi_powershell(self, text: str, block: bool) -> bool:
+        """Speak text via PowerShell when comtypes is not installed."""
+        def run_sapi() -> bool:
             try:
                 # Use PowerShell to speak via SAPI
                 ps_command = f'''
@@ -158,34 +531,49 @@ class TTSEngine:
                 $speak = New-Object System.Speech.Synthesis.SpeechSynthesizer;
                 $speak.Rate = 0;  # Default rate
                 $speak.Volume = 100;  # Default volume
-                $speak.Speak("{text.replace('"', '""')}");
+                $speak.Speak('{text.translate(_PS_SINGLE_QUOTE_ESCAPE)}');
                 '''
 
-                self._current_process = subprocess.Popen(
+                proc = self._current_process = subprocess.Popen(
                     ["powershell", "-Command", ps_command],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE
                 )
 
-                if block:
-                    self._current_process.wait()
+                # Already off the caller's thread when block is False.
+                return proc.wait() == 0
 
             except Exception as e:
                 print(f"SAPI TTS error: {e}")
+                return False
             finally:
                 self._current_process = None
+                self._speaking.clear()
 
+        self._speaking.set()
         if block:
-            run_sapi()
-        else:
-            thread = threading.Thread(target=run_sapi, daemon=True)
-            thread.start()
+            return run_sapi()
+        thread = threading.Thread(target=run_sapi, daemon=True)
+        thread.start()
+        return True
+
+    def _play_audio_file(self, file_path: str) -> bool:
+        """Play an audio file, blocking until it ends or stop_speaking() is called.
 
-    def _play_audio_file(self, file_path: str) -> None:
-        """Play an audio file."""
+        Returns False if the file was handed to an external player, which
+        still needs it after this returns.
+        """
         try:
+            if _has_miniaudio():
+                self._play_miniaudio(file_path)
+                return True
+            if platform.system() == "Windows" and file_path.lower().endswith(".wav"):
+                import winsound
+                # Synchronous; stop_speaking() interrupts it with SND_PURGE.
+                winsound.PlaySound(file_path, winsound.SND_FILENAME)
+                return True
             if platform.system() == "Windows":
-                # Use Windows Media Player or default player
+                # No in-process decoder for this format; use the default player
                 subprocess.run(["cmd", "/c", "start", "", file_path],
                              shell=True, check=True)
             else:
@@ -193,6 +581,32 @@ class TTSEngine:
                 print(f"Audio file generated: {file_path}")
         except Exception as e:
             print(f"Error playing audio file: {e}")
+        return False
+
+    def _play_miniaudio(self, file_path: str) -> None:
+        """Decode and play file_path on a miniaudio playback device."""
+        import miniaudio
+
+        finished = threading.Event()
+        stream = miniaudio.stream_with_callbacks(
+            miniaudio.stream_file(file_path, nchannels=_PLAYBACK_CHANNELS, sample_rate=_PLAYBACK_RATE),
+            end_callback=finished.set,
+        )
+        next(stream)  # prime the generator before handing it to the device
+        device = miniaudio.PlaybackDevice(
+            nchannels=_PLAYBACK_CHANNELS,
+            sample_rate=_PLAYBACK_RATE,
+            buffersize_msec=_PLAYBACK_BUFFER_MS,
+        )
+        self._playback = device
+        try:
+            device.start(stream)
+            while not finished.wait(0.05):
+                if self._stop_requested.is_set():
+                    break
+        finally:
+            self._playback = None
+            device.close()
 
     def speak_selection(self) -> None:
         """Speak currently selected text (clipboard-based approach)."""
@@ -205,6 +619,24 @@ class TTSEngine:
 
     def stop_speaking(self) -> None:
         """Stop current speech."""
+        self._stop_requested.set()
+        if self._playback is not None:
+            try:
+                self._playback.stop()
+            except Exception:
+                pass
+        if platform.system() == "Windows":
+            try:
+                import winsound
+                winsound.PlaySound(None, winsound.SND_PURGE)
+            except Exception:
+                pass
+        if self._sapi is not None:
+            try:
+                # Speaking nothing with the purge flag discards queued speech.
+                self._sapi_run(lambda voice: voice.Speak("", _SVSF_ASYNC | _SVSF_PURGE_BEFORE_SPEAK))
+            except Exception:
+                pass
         if self._current_process:
             try:
                 self._current_process.terminate()
@@ -216,7 +648,16 @@ class TTSEngine:
                     pass
             finally:
                 self._current_process = None
+        self._speaking.clear()
 
     def is_speaking(self) -> bool:
         """Check if TTS is currently speaking."""
-        return self._current_process is not None and self._current_process.poll() is None
+        if self._speaking.is_set():
+            return True
+        # Async COM speech runs on SAPI's own thread, outside _speaking.
+        if self._sapi is not None:
+            try:
+                return self._sapi_run(lambda voice: voice.Status.RunningState) == _SRSE_IS_SPEAKING
+            except Exception:
+                pass
+        return False
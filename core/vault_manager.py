@@ -1,12 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
-import json
+from typing import ClassVar, Dict, Iterator, List, Optional, Tuple
+import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    import json
 
-@dataclass
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write() until all of data is written; it may write less per call."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make a rename in path durable. Not possible (or needed) on Windows."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# eq=False: items are compared by identity, so list.remove() in delete
+# doesn't compare every field of every earlier item.
+@dataclass(slots=True, eq=False)
 class VaultItem:
     id: str
     label: str
@@ -15,9 +45,10 @@ class VaultItem:
     pinned: bool = False
     hotkey: str = ""
     hotstring: str = ""
+    tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VaultZone:
     id: str
     name: str
@@ -25,16 +56,55 @@ class VaultZone:
 
 
 class VaultManager:
+    # Map common lane names to zone IDs
+    _LANE_ZONE_MAP: ClassVar[Dict[str, str]] = {
+        "prompts": "zone1",
+        "api_keys": "zone2",
+        "passwords": "zone3",
+        "notes": "zone4",
+        "snippets": "zone5",
+        "other": "zone6",
+    }
+
+    # Item type given to new items added to a lane
+    _LANE_ITEM_TYPE: ClassVar[Dict[str, str]] = {
+        "prompts": "prompt",
+        "api_keys": "api_key",
+        "passwords": "password",
+        "notes": "note",
+        "snippets": "snippet",
+    }
+
+    # Rewrite the vault file once the change log grows past this many bytes.
+    _LOG_COMPACT_BYTES: ClassVar[int] = 1 << 20
+
     def __init__(self, vault_path: Path) -> None:
         self._path = Path(vault_path)
+        # Single edits are appended here and folded into the vault file by
+        # save(); see _log_change().
+        self._log_path = self._path.with_suffix(".log.jsonl")
+        self._log_pending = False
         self.zones: Dict[str, VaultZone] = {}
+        self._zones_by_name: Dict[str, VaultZone] = {}
+        # Bumped on every load and item change, so callers can cache
+        # anything derived from the vault and just compare numbers.
+        self._generation = 0
+        self._dirty = False
+        self._batch_depth = 0
+        # Every item by id (with its zone), and the next suffix to try per id root.
+        self._by_id: Dict[str, Tuple[VaultZone, VaultItem]] = {}
+        self._id_suffix: Dict[str, int] = {}
+        # Pinned-first sorted view per zone id, built on first request.
+        self._sorted_cache: Dict[str, List[VaultItem]] = {}
 
     def load(self) -> None:
+        self._log_pending = False
         if not self._path.exists():
             self._create_default()
 
-        raw = self._path.read_text(encoding="utf-8").strip() or '{"zones": []}'
-        data = json.loads(raw)
+        # Parse straight from bytes; orjson skips the separate UTF-8 decode.
+        raw = self._path.read_bytes().strip() or b'{"zones": []}'
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         self.zones.clear()
 
         for z in data.get("zones", []):
@@ -47,6 +117,7 @@ class VaultManager:
                     pinned=i.get("pinned", False),
                     hotkey=i.get("hotkey", ""),
                     hotstring=i.get("hotstring", ""),
+                    tags=i.get("tags", []),
                 )
                 for i in z.get("items", [])
             ]
@@ -57,6 +128,17 @@ class VaultManager:
             )
             self.zones[zone.id] = zone
 
+        self._zones_by_name = {z.name: z for z in self.zones.values()}
+        self._by_id = {i.id: (z, i) for z in self.zones.values() for i in z.items}
+        self._id_suffix.clear()
+        self._sorted_cache.clear()
+        replayed = self._replay_log()
+        self._generation += 1
+        if replayed:
+            # Compact on load: fold the replayed edits into the vault file and
+            # drop the log, so new appends never land after a torn line.
+            self.save()
+
     def _create_default(self) -> None:
         data = {
             "zones": [
@@ -67,47 +149,249 @@ class VaultManager:
                 )
             ]
         }
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self._path.write_bytes(self._dumps(data))
 
     def save(self) -> None:
-        data = {
-            "zones": []
+        if self._batch_depth:
+            # Deferred until the outermost batch() exits.
+            self._dirty = True
+            return
 
+        # One nested comprehension; the item literal is _item_to_dict() inlined
+        # so large vaults don't pay a method call per item.
+        data = {"zones": [
+            {"id": z.id, "name": z.name, "items": [
+                {"id": i.id, "label": i.label, "type": i.type, "value": i.value,
+                 "pinned": i.pinned, "hotkey": i.hotkey, "hotstring": i.hotstring,
+                 "tags": i.tags}
+                for i in z.items
+            ]}
+            for z in self.zones.values()
+        ]}
+        self._write_atomic(self._dumps(data))
+        self._dirty = False
+        # Everything in the change log is now part of the vault file.
+        self._log_path.unlink(missing_ok=True)
+        self._log_pending = False
+
+    def compact(self) -> None:
+        """Fold any logged edits into the vault file (e.g. on shutdown)."""
+        if self._log_pending:
+            self.save()
+
+    @staticmethod
+    def _dumps(data: dict) -> bytes:
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _write_atomic(self, payload: bytes) -> None:
+        # Same temp-file + rename approach as CommandRegistry.save().
+        tmp = self._path.with_suffix(".json.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_all(fd, payload)
+            # save() deletes the change log next, so the new file has to be
+            # on disk before that, not just in the page cache.
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self._path)
+        _fsync_dir(self._path.parent)
+
+    # ---------- change log ----------
+
+    @staticmethod
+    def _item_to_dict(item: VaultItem) -> dict:
+        return {
+            "id": item.id,
+            "label": item.label,
+            "type": item.type,
+            "value": item.value,
+            "pinned": item.pinned,
+            "hotkey": item.hotkey,
+            "hotstring": item.hotstring,
+            "tags": item.tags,
         }
-        for zone in self.zones.values():
-            data["zones"].append({
-                "id": zone.id,
-                "name": zone.name,
-                "items": [i.__dict__ for i in zone.items],
-            })
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    def _log_change(self, record: dict) -> None:
+        """
+        Persist one edit by appending it to the change log instead of
+        rewriting the whole vault file.
+        """
+        if self._batch_depth:
+            # The batch ends with a full save() anyway.
+            self._dirty = True
+            return
+
+        line = (orjson.dumps(record) if orjson else json.dumps(record).encode("utf-8")) + b"\n"
+        fd = os.open(self._log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            _write_all(fd, line)
+            os.fsync(fd)
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        self._log_pending = True
+
+        if size > self._LOG_COMPACT_BYTES:
+            self.save()
+
+    def _replay_log(self) -> bool:
+        """Apply the change log, if there is one. Returns whether there was."""
+        if not self._log_path.exists():
+            return False
+
+        for line in self._log_path.read_bytes().splitlines():
+            try:
+                record = orjson.loads(line) if orjson else json.loads(line)
+            except ValueError:
+                # A torn final line from an interrupted write; nothing follows it.
+                break
+            self._apply_change(record)
+        return True
+
+    def _apply_change(self, record: dict) -> None:
+        # Replays are idempotent, so a log left behind by a save() that died
+        # before unlinking it can be applied over the new file again.
+        op = record.get("op")
+        if op == "add":
+            zone = self.zones.get(record["zone"])
+            if zone is None:
+                return
+            item = VaultItem(**record["item"])
+            old = self._by_id.get(item.id)
+            if old is not None:
+                old[0].items.remove(old[1])
+            zone.items.append(item)
+            self._by_id[item.id] = (zone, item)
+        elif op == "update":
+            item = self.find_item(record["id"])
+            if item is not None:
+                for name, value in record["fields"].items():
+                    setattr(item, name, value)
+        elif op == "delete":
+            entry = self._by_id.pop(record["id"], None)
+            if entry is not None:
+                entry[0].items.remove(entry[1])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several add/update/delete calls into a single write of the
+        vault file:
+
+            with vault.batch():
+                for title, text in snippets:
+                    vault.add_item(title, text, "snippets")
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save()
 
     def get_lane_items(self, lane: str, include_pinned: bool = True) -> List[VaultItem]:
         """Get all items in a specific lane."""
-        # Map common lane names to zone IDs
-        zone_mapping = {
-            "prompts": "zone1",
-            "api_keys": "zone2",
-            "passwords": "zone3",
-            "notes": "zone4",
-            "snippets": "zone5",
-            "other": "zone6"
-        }
-
-        zone_id = zone_mapping.get(lane, lane)
-        zone = self.zones.get(zone_id)
+        zone = self.zones.get(self._zone_id_for_lane(lane))
         if not zone:
             return []
 
-        items = zone.items
-        if include_pinned:
-            # Sort pinned items first, then by label
-            items.sort(key=lambda x: (not x.pinned, x.label.lower()))
-        return items
+        if not include_pinned:
+            return list(zone.items)
+
+        # Sort pinned items first, then by label, without reordering the
+        # zone itself (the vault tab addresses zone.items by row).
+        items = self._sorted_cache.get(zone.id)
+        if items is None:
+            items = sorted(zone.items, key=lambda x: (not x.pinned, x.label.lower()))
+            self._sorted_cache[zone.id] = items
+        return list(items)
+
+    # ---------- mutation ----------
+
+    def add_item(self, label: str, value: str, lane: str,
+                 tags: Optional[List[str]] = None) -> str:
+        """Add an item to a lane and return its new id."""
+        zone = self.zones.get(self._zone_id_for_lane(lane))
+        if not zone:
+            raise ValueError(f"Unknown vault lane: {lane}")
+
+        # Generate a unique ID from the label, resuming the suffix probe
+        # where the last add with the same root left off.
+        root = label.lower().replace(" ", "_") or "item"
+        n = self._id_suffix.get(root, 0)
+        item_id = f"{root}_{n}" if n else root
+        while item_id in self._by_id:
+            n += 1
+            item_id = f"{root}_{n}"
+        self._id_suffix[root] = n + 1
+
+        item = VaultItem(
+            id=item_id,
+            label=label,
+            type=self._LANE_ITEM_TYPE.get(lane.lower(), "note"),
+            value=value,
+            tags=tags or [],
+        )
+        zone.items.append(item)
+        self._by_id[item_id] = (zone, item)
+        self._sorted_cache.pop(zone.id, None)
+        self._generation += 1
+        self._log_change({"op": "add", "zone": zone.id, "item": self._item_to_dict(item)})
+        return item_id
+
+    def update_item(self, item_id: str, **fields) -> bool:
+        item = self.find_item(item_id)
+        if not item:
+            return False
+
+        # Ids are fixed once assigned; the id index relies on it.
+        fields.pop("id", None)
+        applied = {}
+        for name, value in fields.items():
+            if value is not None and hasattr(item, name):
+                setattr(item, name, value)
+                applied[name] = value
+                if name in ("label", "pinned"):
+                    self._sorted_cache.pop(self._by_id[item_id][0].id, None)
+        if applied:
+            self._generation += 1
+            self._log_change({"op": "update", "id": item_id, "fields": applied})
+        return True
+
+    def delete_item(self, item_id: str) -> bool:
+        entry = self._by_id.pop(item_id, None)
+        if entry is None:
+            return False
+
+        zone, item = entry
+        zone.items.remove(item)
+        self._sorted_cache.pop(zone.id, None)
+        self._generation += 1
+        self._log_change({"op": "delete", "id": item_id})
+        return True
+
+    def _zone_id_for_lane(self, lane: str) -> str:
+        return self._LANE_ZONE_MAP.get(lane.lower(), lane)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_zone_by_name(self, name: str) -> Optional[VaultZone]:
+        return self._zones_by_name.get(name)
+
+    def get_zone_items(self, name: str) -> List[VaultItem]:
+        """Shallow copy of a zone's items, looked up by zone name."""
+        zone = self._zones_by_name.get(name)
+        return list(zone.items) if zone else []
+
+    def zone_names(self) -> List[str]:
+        return list(self._zones_by_name)
 
     def find_item(self, item_id: str) -> Optional[VaultItem]:
-        for zone in self.zones.values():
-            for item in zone.items:
-                if item.id == item_id:
-                    return item
-        return None
+        entry = self._by_id.get(item_id)
+        return entry[1] if entry else None
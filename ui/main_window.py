@@ -2,35 +2,123 @@
 from __future__ import annotations
 
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QMessageBox, QLabel
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Signal
+)
+from PySide6.QtGui import QGuiApplication, QKeySequence, QShortcut
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from core.command_registry import CommandRegistry
     from core.settings_manager import SettingsManager
-    from core.vault_manager import VaultManager
+    from core.vault_manager import VaultItem, VaultManager
     from core.ai_clients import AIClientManager
     from core.tts_engine import TTSEngine
 
-# Import all working tab classes and adapters
-from .tabs.chat_tab import ChatTab
-from .tabs.audio_tab_simple import AudioTab
-from .tabs.tts_preprocessor_tab import TTSPreprocessorTab
-from .tabs.shortcuts_manager_tab import ShortcutsManagerTab
-from .tabs.prompts_tab import PromptsTab
-from .tabs.prompts_manager_tab import PromptsManagerTab
-from .tabs.spelling_tab import SpellingTab
-from .tabs.search_scraper_tab import SearchScraperTab
-from .tabs.settings_tab import SettingsTab
+    from .tabs.adapters import PromptManagerAdapter
+
+# Tab modules (and whatever they pull in) are imported by the _build_*_tab
+# factories below, the first time each tab is shown.
 # Temporarily using placeholders for complex tabs
 # from .tabs.clipboard_window import ClipboardWindow
 # from .tabs.window_control_panel import WindowControlPanel
-from .tabs.adapters import OpenAIClientAdapter, TTSAdapter, PromptManagerAdapter, ShortcutsAdapter
+
+
+class _TabLoaderSignals(QObject):
+    loaded = Signal(int, object)  # tab index, prepared payload
+    failed = Signal(int, str)
+
+
+class _TabLoader(QRunnable):
+    """Runs a tab's non-widget setup (I/O, enumeration) on the thread pool."""
+
+    def __init__(self, idx: int, prepare: Callable[[], Any]) -> None:
+        super().__init__()
+        self.idx = idx
+        self.prepare = prepare
+        self.signals = _TabLoaderSignals()
+
+    def run(self) -> None:
+        try:
+            payload = self.prepare()
+        except Exception as e:
+            self.signals.failed.emit(self.idx, str(e))
+        else:
+            self.signals.loaded.emit(self.idx, payload)
+
+
+# Row suffixes for _format_vault_label(), built once.
+_PINNED_SUFFIX = " (📌 )"
+_UNPINNED_SUFFIX = " ()"
+
+
+@lru_cache(maxsize=4096)
+def _format_vault_label(label: str, pinned: bool) -> str:
+    # Rendered text is memoised per (label, pinned), so flipping between
+    # lanes reuses the strings instead of rebuilding them.
+    return label + (_PINNED_SUFFIX if pinned else _UNPINNED_SUFFIX)
+
+
+class VaultItemsModel(QAbstractListModel):
+    """
+    Rows of one vault lane for a QListView. Only visible rows are ever
+    asked for their text; there is no per-row QListWidgetItem.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._items: List[VaultItem] = []
+        # Row text as last shown; items are mutable, so this is what
+        # update_items() diffs against.
+        self._labels: List[str] = []
+
+    def set_items(self, items: List[VaultItem]) -> None:
+        self.beginResetModel()
+        self._items = items
+        self._labels = [_format_vault_label(i.label, i.pinned) for i in items]
+        self.endResetModel()
+
+    def update_items(self, items: List[VaultItem]) -> None:
+        """
+        Like set_items(), but when the row count is unchanged only rows whose
+        text differs are signalled, so selection and scroll position survive.
+        """
+        if len(items) != len(self._items):
+            self.set_items(items)
+            return
+
+        labels = [_format_vault_label(i.label, i.pinned) for i in items]
+        self._items = items
+        for row, (old, new) in enumerate(zip(self._labels, labels)):
+            if old != new:
+                self._labels[row] = new
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def item_at(self, row: int) -> Optional[VaultItem]:
+        return self._items[row] if 0 <= row < len(self._items) else None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        return self._labels[row] if 0 <= row < len(self._labels) else None
 
 
 class MainWindow(QMainWindow):
+    # Parsed once for the whole window; labels pick rules up by objectName.
+    _STYLESHEET = """
+        QLabel#TabTitle { font-size: 16px; font-weight: bold; margin-bottom: 10px; }
+        QLabel#TabInfo { color: #666; }
+        QLabel#TabError { font-size: 14px; font-weight: bold; color: red; margin-bottom: 10px; }
+        QLabel#TabErrorDetails { color: #666; margin: 10px; }
+    """
+
     def __init__(self,
                  settings: SettingsManager,
                  command_registry: CommandRegistry,
@@ -44,8 +132,20 @@ class MainWindow(QMainWindow):
         self.ai_manager = ai_manager
         self.tts_engine = tts_engine
 
+        # Tab index -> (builder, optional off-thread prepare step) for tabs
+        # that haven't been shown yet
+        self._tab_factories: Dict[int, Tuple[Callable[..., QWidget], Optional[Callable[[], Any]]]] = {}
+        # Tab index -> (builder, its running _TabLoader); holding the loader
+        # keeps its signal emitter alive until the result is delivered
+        self._pending_tabs: Dict[int, Tuple[Callable[[Any], QWidget], _TabLoader]] = {}
+        self._prompts_adapter: Optional[PromptManagerAdapter] = None
+        self._vault_tab: Optional[QWidget] = None
+        # The application-wide clipboard object lives as long as the app.
+        self._clipboard = QGuiApplication.clipboard()
+
         self.setWindowTitle("Stratum")
         self.setGeometry(100, 100, 1400, 900)
+        self.setStyleSheet(self._STYLESHEET)
 
         # Check for "always on top" setting
         always_on_top = settings.config.getboolean("stratum", "window_on_top", fallback=False)
@@ -72,177 +172,282 @@ class MainWindow(QMainWindow):
         self._add_all_tabs()
 
     def _add_all_tabs(self) -> None:
-        """Add all functional tabs in the correct order with Stratum backend wiring."""
+        """Add all functional tabs in the correct order with Stratum backend wiring.
+
+        Each tab starts as an empty placeholder and is only built the first
+        time it is shown; see _materialize_tab().
+        """
         try:
             # 1. Chat Tab - uses AI manager
-            chat_tab = ChatTab(self.ai_manager)
-            self.tab_widget.addTab(chat_tab, "Chat")
+            self._add_lazy_tab("Chat", self._build_chat_tab)
 
             # 2. Voice Tab - uses TTS engine
-            voice_tab = AudioTab(self.tts_engine)
-            self.tab_widget.addTab(voice_tab, "Voice")
+            self._add_lazy_tab("Voice", self._build_voice_tab, prepare=self._prepare_voice_tab)
 
             # 3. TTS Preprocessor Tab - basic text preprocessing
-            tts_prep_tab = TTSPreprocessorTab()
-            self.tab_widget.addTab(tts_prep_tab, "TTS Prep")
+            self._add_lazy_tab("TTS Prep", self._build_tts_prep_tab)
 
             # 4. Shortcuts Tab - uses shortcuts adapter with command registry
-            shortcuts_adapter = ShortcutsAdapter(self.command_registry)
-            shortcuts_tab = ShortcutsManagerTab(shortcuts_adapter)
-            self.tab_widget.addTab(shortcuts_tab, "Shortcuts")
+            self._add_lazy_tab("Shortcuts", self._build_shortcuts_tab)
 
             # 5. Prompts Tab - uses vault manager via adapter
-            prompts_adapter = PromptManagerAdapter(self.vault_manager)
-            prompts_tab = PromptsTab(prompts_adapter)
-            self.tab_widget.addTab(prompts_tab, "Prompts")
+            self._add_lazy_tab("Prompts", self._build_prompts_tab)
 
             # 6. Prompts Manager Tab - uses vault manager via adapter
-            prompts_manager_tab = PromptsManagerTab(prompts_adapter)
-            self.tab_widget.addTab(prompts_manager_tab, "Prompts Mgr")
+            self._add_lazy_tab("Prompts Mgr", self._build_prompts_manager_tab)
 
             # 7. Spelling Tab - basic text checking
-            spelling_tab = SpellingTab()
-            self.tab_widget.addTab(spelling_tab, "Spelling")
+            self._add_lazy_tab("Spelling", self._build_spelling_tab)
 
             # 8. Search Tab - placeholder for now
-            search_tab = self._create_simple_placeholder("Search Tab", "Search and scraping functionality")
-            self.tab_widget.addTab(search_tab, "Search")
+            self._add_lazy_tab("Search", lambda: self._create_simple_placeholder(
+                "Search Tab", "Search and scraping functionality"))
 
             # 9. Clipboard Tab - placeholder for now
-            clipboard_tab = self._create_simple_placeholder("Clipboard Tab", "Clipboard management functionality")
-            self.tab_widget.addTab(clipboard_tab, "Clipboard")
+            self._add_lazy_tab("Clipboard", lambda: self._create_simple_placeholder(
+                "Clipboard Tab", "Clipboard management functionality"))
 
             # 10. Window Manager Tab - placeholder for now
-            window_tab = self._create_simple_placeholder("Window Manager", "Window control and automation")
-            self.tab_widget.addTab(window_tab, "Windows")
+            self._add_lazy_tab("Windows", lambda: self._create_simple_placeholder(
+                "Window Manager", "Window control and automation"))
 
             # 11. Vault Tab - uses vault manager directly
-            vault_tab = self._create_vault_tab()
-            self.tab_widget.addTab(vault_tab, "Vault")
+            self._add_lazy_tab("Vault", self._create_vault_tab)
 
             # 12. Settings Tab - uses settings manager
-            settings_tab = self._create_settings_tab()
-            self.tab_widget.addTab(settings_tab, "Settings")
+            self._add_lazy_tab("Settings", self._create_settings_tab)
 
         except Exception as e:
             print(f"Error creating tabs: {e}")
             import traceback
             traceback.print_exc()
             # Add a basic fallback tab
-            fallback_tab = QWidget()
-            layout = QVBoxLayout(fallback_tab)
-            layout.addWidget(QMessageBox(self, text=f"Error loading tabs: {str(e)}"))
-            self.tab_widget.addTab(fallback_tab, "Error")
-
-    def _create_simple_placeholder(self, title: str, description: str) -> QWidget:
-        """Create a simple placeholder tab."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
+            self.tab_widget.addTab(self._create_error_tab("tabs", str(e)), "Error")
+
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        # Only the tab visible at startup is built up front.
+        self._materialize_tab(self.tab_widget.currentIndex())
+
+    def _add_lazy_tab(self, label: str, factory: Callable[..., QWidget],
+                      prepare: Optional[Callable[[], Any]] = None) -> None:
+        """Add a cheap placeholder tab that factory() replaces on first show.
+
+        If prepare is given it runs on the thread pool first, and its result
+        is passed to factory() back on the UI thread.
+        """
+        idx = self.tab_widget.addTab(QWidget(), label)
+        self._tab_factories[idx] = (factory, prepare)
+
+    def _materialize_tab(self, idx: int) -> None:
+        """Swap the placeholder at idx for the real tab, if not built yet."""
+        entry = self._tab_factories.pop(idx, None)
+        if entry is None:
+            return
 
-        title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
-        layout.addWidget(title_label, alignment=Qt.AlignCenter)
+        factory, prepare = entry
+        if prepare is None:
+            self._install_tab(idx, factory)
+            return
 
-        desc_label = QLabel(description)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin: 20px;")
-        layout.addWidget(desc_label, alignment=Qt.AlignCenter)
+        # Show something while the worker runs; widgets are only ever
+        # created here on the UI thread.
+        placeholder_layout = QVBoxLayout(self.tab_widget.widget(idx))
+        placeholder_layout.addWidget(QLabel("Loading…"), alignment=Qt.AlignCenter)
+
+        loader = _TabLoader(idx, prepare)
+        loader.signals.loaded.connect(self._on_tab_prepared)
+        loader.signals.failed.connect(self._on_tab_prepare_failed)
+        self._pending_tabs[idx] = (factory, loader)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_tab_prepared(self, idx: int, payload: Any) -> None:
+        pending = self._pending_tabs.pop(idx, None)
+        if pending is not None:
+            factory = pending[0]
+            self._install_tab(idx, lambda: factory(payload))
+
+    def _on_tab_prepare_failed(self, idx: int, error: str) -> None:
+        if self._pending_tabs.pop(idx, None) is not None:
+            label = self.tab_widget.tabText(idx)
+            print(f"Error creating {label} tab: {error}")
+            self._swap_tab(idx, self._create_error_tab(label, error))
+
+    def _install_tab(self, idx: int, build: Callable[[], QWidget]) -> None:
+        # The one error guard for tab construction; builders don't catch.
+        label = self.tab_widget.tabText(idx)
+        try:
+            widget = build()
+        except Exception as e:
+            print(f"Error creating {label} tab: {e}")
+            import traceback
+            traceback.print_exc()
+            widget = self._create_error_tab(label, str(e))
+        self._swap_tab(idx, widget)
+
+    def _swap_tab(self, idx: int, widget: QWidget) -> None:
+        """Replace the placeholder at idx with widget, keeping the selection."""
+        label = self.tab_widget.tabText(idx)
+        current = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(idx)
+        # Removing the current tab moves the selection; keep currentChanged
+        # quiet so that doesn't build a neighbouring tab as well.
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(idx)
+            self.tab_widget.insertTab(idx, widget, label)
+            self.tab_widget.setCurrentIndex(current)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _get_prompts_adapter(self) -> PromptManagerAdapter:
+        """Adapter shared by the Prompts and Prompts Mgr tabs."""
+        if self._prompts_adapter is None:
+            from .tabs.adapters import PromptManagerAdapter
+            self._prompts_adapter = PromptManagerAdapter(self.vault_manager)
+        return self._prompts_adapter
+
+    # ---------- tab factories ----------
+
+    def _build_chat_tab(self) -> QWidget:
+        from .tabs.chat_tab import ChatTab
+        return ChatTab(self.ai_manager)
+
+    def _prepare_voice_tab(self) -> list:
+        # Voice enumeration may go out to the network; runs on the thread pool.
+        return self.tts_engine.get_available_voices()
+
+    def _build_voice_tab(self, voices: list) -> QWidget:
+        from core.audio_engine import whisper_available
+        from .tabs.audio_tab import AudioTab
+        # Transcription needs faster-whisper; without it only show TTS.
+        mode = "full" if whisper_available() else "simple"
+        return AudioTab(self.tts_engine, voices=voices, mode=mode)
+
+    def _build_tts_prep_tab(self) -> QWidget:
+        from .tabs.tts_preprocessor_tab import TTSPreprocessorTab
+        return TTSPreprocessorTab()
+
+    def _build_shortcuts_tab(self) -> QWidget:
+        from .tabs.adapters import ShortcutsAdapter
+        from .tabs.shortcuts_manager_tab import ShortcutsManagerTab
+        return ShortcutsManagerTab(ShortcutsAdapter(self.command_registry))
+
+    def _build_prompts_tab(self) -> QWidget:
+        from .tabs.prompts_tab import PromptsTab
+        return PromptsTab(self._get_prompts_adapter())
+
+    def _build_prompts_manager_tab(self) -> QWidget:
+        from .tabs.prompts_manager_tab import PromptsManagerTab
+        return PromptsManagerTab(self._get_prompts_adapter())
+
+    def _build_spelling_tab(self) -> QWidget:
+        from .tabs.spelling_tab import SpellingTab
+        return SpellingTab()
 
-        layout.addStretch()
+    def _create_simple_placeholder(self, title: str, description: str) -> QWidget:
+        """Create a simple placeholder tab: one rich-text label, no layout."""
+        widget = QLabel(
+            f"<p style='font-size: 16px; font-weight: bold;'>{title}</p>"
+            f"<p style='color: #666;'>{description}</p>"
+        )
+        widget.setTextFormat(Qt.RichText)
+        widget.setAlignment(Qt.AlignCenter)
+        widget.setWordWrap(True)
         return widget
 
     def _create_vault_tab(self) -> QWidget:
         """Create the vault tab UI."""
-        try:
-            widget = QWidget()
-            layout = QVBoxLayout(widget)
-
-            title = QLabel("Vault - 6-Lane Deep Storage")
-            title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
-            layout.addWidget(title)
-
-            # Lane selector
-            from PySide6.QtWidgets import QListWidget, QHBoxLayout, QTextEdit, QPushButton
-            lanes_layout = QHBoxLayout()
-            self.vault_lane_list = QListWidget()
-
-            # Get zone names from vault manager
-            self.vault_manager.load()  # Ensure loaded
-            for zone in self.vault_manager.zones.values():
-                self.vault_lane_list.addItem(zone.name)
-
-            self.vault_lane_list.itemSelectionChanged.connect(self._on_vault_lane_changed)
-            lanes_layout.addWidget(self.vault_lane_list)
-
-            # Item list and content
-            content_layout = QVBoxLayout()
-            self.vault_item_list = QListWidget()
-            self.vault_item_list.itemDoubleClicked.connect(self._on_vault_item_selected)
-            content_layout.addWidget(self.vault_item_list)
-
-            self.vault_content = QTextEdit()
-            self.vault_content.setReadOnly(True)
-            content_layout.addWidget(self.vault_content)
-
-            lanes_layout.addLayout(content_layout)
-            layout.addLayout(lanes_layout)
-
-            # Buttons
-            buttons_layout = QHBoxLayout()
-            copy_btn = QPushButton("Copy")
-            copy_btn.clicked.connect(self._vault_copy_item)
-            buttons_layout.addWidget(copy_btn)
-
-            insert_btn = QPushButton("Insert")
-            insert_btn.clicked.connect(self._vault_insert_item)
-            buttons_layout.addWidget(insert_btn)
-
-            edit_btn = QPushButton("Edit")
-            edit_btn.clicked.connect(self._vault_edit_item)
-            buttons_layout.addWidget(edit_btn)
-
-            layout.addLayout(buttons_layout)
-
-            # Load initial lane if available
-            if self.vault_lane_list.count() > 0:
-                self.vault_lane_list.setCurrentRow(0)
-
-            return widget
-        except Exception as e:
-            return self._create_error_tab("Vault", str(e))
+        from PySide6.QtWidgets import QGridLayout, QListView, QListWidget, QTextEdit, QPushButton
+        widget = QWidget()
+        # One grid instead of nested box layouts:
+        #   title  | title      | title
+        #   lanes  | items      | items
+        #   lanes  | content    | content
+        #   Copy   | Insert     | Edit
+        grid = QGridLayout(widget)
+
+        title = QLabel("Vault - 6-Lane Deep Storage")
+        title.setObjectName("TabTitle")
+        grid.addWidget(title, 0, 0, 1, 3)
+
+        # Lane selector
+        self.vault_lane_list = QListWidget()
+        self.vault_lane_list.setUniformItemSizes(True)
+
+        # Get zone names from vault manager
+        self._fill_list_widget(self.vault_lane_list, self.vault_manager.zone_names())
+
+        # Arrow-keying through lanes fires a selection change per row;
+        # only load the lane the selection settles on.
+        self._lane_debounce = QTimer(self)
+        self._lane_debounce.setSingleShot(True)
+        self._lane_debounce.setInterval(50)
+        self._lane_debounce.timeout.connect(self._load_selected_vault_lane)
+        self.vault_lane_list.itemSelectionChanged.connect(self._on_vault_lane_changed)
+        grid.addWidget(self.vault_lane_list, 1, 0, 2, 1)
+
+        # Item list and content
+        self.vault_item_list = QListView()
+        self.vault_items_model = VaultItemsModel(self.vault_item_list)
+        self.vault_item_list.setModel(self.vault_items_model)
+        # Every row is the same height; lets the view skip measuring them.
+        self.vault_item_list.setUniformItemSizes(True)
+        self.vault_item_list.doubleClicked.connect(self._on_vault_item_selected)
+        grid.addWidget(self.vault_item_list, 1, 1, 1, 2)
+
+        self.vault_content = QTextEdit()
+        self.vault_content.setReadOnly(True)
+        grid.addWidget(self.vault_content, 2, 1, 1, 2)
+
+        # Buttons
+        for col, (text, slot) in enumerate((
+            ("Copy", self._vault_copy_item),
+            ("Insert", self._vault_insert_item),
+            ("Edit", self._vault_edit_item),
+        )):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            grid.addWidget(button, 3, col)
+
+        # Load initial lane if available
+        if self.vault_lane_list.count() > 0:
+            self.vault_lane_list.setCurrentRow(0)
+
+        self._vault_tab = widget
+        return widget
 
     def _create_settings_tab(self) -> QWidget:
         """Create the settings tab."""
-        try:
-            # For now, create a simple settings placeholder
-            widget = QWidget()
-            layout = QVBoxLayout(widget)
+        # For now, create a simple settings placeholder
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
 
-            title = QLabel("Settings")
-            title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
-            layout.addWidget(title)
+        title = QLabel("Settings")
+        title.setObjectName("TabTitle")
+        layout.addWidget(title)
 
-            # Basic settings info
-            info_label = QLabel("Settings panel - API keys and preferences")
-            info_label.setStyleSheet("color: #666;")
-            layout.addWidget(info_label)
+        # Basic settings info
+        info_label = QLabel("Settings panel - API keys and preferences")
+        info_label.setObjectName("TabInfo")
+        layout.addWidget(info_label)
 
-            # API key status
-            status_layout = QVBoxLayout()
-            openai_key = self.settings.get_api_key("openai")
-            claude_key = self.settings.get_api_key("claude")
+        # API key status
+        status_layout = QVBoxLayout()
+        # Only presence is shown, so the tab never touches the keys.
+        has_openai = self.settings.has_api_key("openai")
+        has_claude = self.settings.has_api_key("claude")
 
-            openai_status = QLabel(f"OpenAI Key: {'✓ Set' if openai_key else '✗ Not set'}")
-            claude_status = QLabel(f"Claude Key: {'✓ Set' if claude_key else '✗ Not set'}")
+        openai_status = QLabel(f"OpenAI Key: {'✓ Set' if has_openai else '✗ Not set'}")
+        claude_status = QLabel(f"Claude Key: {'✓ Set' if has_claude else '✗ Not set'}")
 
-            status_layout.addWidget(openai_status)
-            status_layout.addWidget(claude_status)
-            layout.addLayout(status_layout)
+        status_layout.addWidget(openai_status)
+        status_layout.addWidget(claude_status)
+        layout.addLayout(status_layout)
 
-            layout.addStretch()
-            return widget
-        except Exception as e:
-            return self._create_error_tab("Settings", str(e))
+        layout.addStretch()
+        return widget
 
     def _create_error_tab(self, tab_name: str, error_msg: str) -> QWidget:
         """Create an error tab for when tab creation fails."""
@@ -250,12 +455,12 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(widget)
 
         error_label = QLabel(f"Error loading {tab_name} tab")
-        error_label.setStyleSheet("font-size: 14px; font-weight: bold; color: red; margin-bottom: 10px;")
+        error_label.setObjectName("TabError")
         layout.addWidget(error_label, alignment=Qt.AlignCenter)
 
         error_details = QLabel(f"Details: {error_msg}")
         error_details.setWordWrap(True)
-        error_details.setStyleSheet("color: #666; margin: 10px;")
+        error_details.setObjectName("TabErrorDetails")
         layout.addWidget(error_details, alignment=Qt.AlignCenter)
 
         layout.addStretch()
@@ -268,68 +473,72 @@ class MainWindow(QMainWindow):
         self.command_registry.register_handler("ui.toggle_main", self._toggle_main_window)
 
     def _toggle_main_window(self) -> None:
-        """Toggle main window visibility."""
-        if self.isVisible():
+        """Toggle main window visibility.
+
+        A visible window that is behind other windows is brought forward
+        rather than hidden; only an already-active window is hidden.
+        """
+        if self.isVisible() and self.isActiveWindow():
             self.hide()
-        else:
+            return
+        if not self.isVisible():
             self.show()
-            self.raise_()
-            self.activateWindow()
+        self.raise_()
+        self.activateWindow()
 
     # Vault tab methods
     def _on_vault_lane_changed(self) -> None:
-        """Handle vault lane selection change."""
+        """Handle vault lane selection change (debounced)."""
+        self._lane_debounce.start()
+
+    def _load_selected_vault_lane(self) -> None:
         current_item = self.vault_lane_list.currentItem()
         if current_item:
             lane_name = current_item.text()
             self._load_vault_lane(lane_name)
 
-    def _load_vault_lane(self, lane_name: str) -> None:
-        """Load items for a specific vault lane."""
-        self.vault_item_list.clear()
-
-        # Find the zone by name
-        zone = None
-        for z in self.vault_manager.zones.values():
-            if z.name == lane_name:
-                zone = z
-                break
-
-        if zone:
-            for item in zone.items:
-                display_text = f"{item.label} ({'📌 ' if item.pinned else ''})"
-                self.vault_item_list.addItem(display_text)
-
-    def _on_vault_item_selected(self, item) -> None:
-        """Handle vault item selection."""
-        if not item:
-            return
+    def _on_tab_changed(self, idx: int) -> None:
+        # Other tabs (Prompts, Prompts Mgr) edit the vault; pick that up
+        # when coming back to the vault tab.
+        if self._vault_tab is not None and self.tab_widget.widget(idx) is self._vault_tab:
+            self._refresh_vault_lane_if_changed()
 
-        # Find the selected zone
-        current_lane_item = self.vault_lane_list.currentItem()
-        if not current_lane_item:
+    def _refresh_vault_lane_if_changed(self) -> None:
+        """Re-read the selected lane, touching only rows that changed."""
+        current_item = self.vault_lane_list.currentItem()
+        if not current_item:
             return
+        self.vault_items_model.update_items(self.vault_manager.get_zone_items(current_item.text()))
 
-        lane_name = current_lane_item.text()
-        zone = None
-        for z in self.vault_manager.zones.values():
-            if z.name == lane_name:
-                zone = z
-                break
+    def _load_vault_lane(self, lane_name: str) -> None:
+        """Load items for a specific vault lane."""
+        # A shallow copy of the lane (item references only), so vault edits
+        # made elsewhere can't change the row count under the view.
+        self.vault_items_model.set_items(self.vault_manager.get_zone_items(lane_name))
+
+    @staticmethod
+    def _fill_list_widget(list_widget, texts: List[str]) -> None:
+        """Replace a QListWidget's rows in one batch, without per-row repaints or signals."""
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            list_widget.addItems(texts)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
 
-        if zone:
-            item_index = self.vault_item_list.row(item)
-            if 0 <= item_index < len(zone.items):
-                vault_item = zone.items[item_index]
-                self.vault_content.setPlainText(vault_item.value)
+    def _on_vault_item_selected(self, index: QModelIndex) -> None:
+        """Handle vault item selection."""
+        vault_item = self.vault_items_model.item_at(index.row())
+        if vault_item:
+            self.vault_content.setPlainText(vault_item.value)
 
     def _vault_copy_item(self) -> None:
         """Copy selected vault item content to clipboard."""
         content = self.vault_content.toPlainText()
         if content:
-            from PySide6.QtWidgets import QApplication
-            clipboard = QApplication.clipboard()
-            clipboard.setText(content)
+            self._clipboard.setText(content)
 
     def _vault_insert_item(self) -> None:
         """Insert vault item content at cursor (placeholder)."""
@@ -341,14 +550,38 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Handle application close."""
-        # Save any pending settings
+        # Save any pending settings (no-op when nothing changed)
         try:
-            self.settings._config.write(open(self.settings._path, 'w', encoding='utf-8'))
-        except Exception:
-            pass
+            self.settings.save_if_dirty()
+        except Exception as e:
+            print(f"Error saving settings: {e}")
 
+        # Fold the vault's append-only change log back into vault.json
+        try:
+            self.vault_manager.compact()
+        except Exception as e:
+            print(f"Error saving vault: {e}")
+
+        self._clear_all_tabs()
         event.accept()
 
+    def _clear_all_tabs(self) -> None:
+        """Remove and destroy every tab, last first.
+
+        Removing from the end means no remaining tab has to shift index and
+        the tab bar isn't re-laid out for every tab still in front of it.
+        """
+        self._tab_factories.clear()
+        self._pending_tabs.clear()
+        self.tab_widget.blockSignals(True)
+        try:
+            for i in range(self.tab_widget.count() - 1, -1, -1):
+                widget = self.tab_widget.widget(i)
+                self.tab_widget.removeTab(i)
+                widget.deleteLater()
+        finally:
+            self.tab_widget.blockSignals(False)
+
 
 def create_main_window(settings: SettingsManager,
                       command_registry: CommandRegistry,
@@ -4,7 +4,9 @@ Adapters to make AI Hub tabs work with Stratum core systems.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Dict, Any, Optional
+import asyncio
+import threading
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Any, Optional, Tuple
 
 if TYPE_CHECKING:
     from core.ai_clients import AIClientManager
@@ -13,6 +15,24 @@ if TYPE_CHECKING:
     from core.command_registry import CommandRegistry
 
 
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """One long-lived event loop on a daemon thread for synchronous callers.
+
+    Reusing it keeps the per-loop HTTP connection pool in core.ai_clients
+    warm between calls instead of building and tearing down a loop each time.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ai-adapter-loop", daemon=True).start()
+        return _loop
+
+
 class OpenAIClientAdapter:
     """Adapter to make Stratum AI clients work like the old OpenAIClient."""
 
@@ -21,26 +41,29 @@ class OpenAIClientAdapter:
         self.provider = provider
         self.client = ai_manager.get_client(provider)
 
-    def chat(self, system: str, message: str) -> str:
-        """Synchronous chat method for compatibility."""
-        import asyncio
-        import nest_asyncio
-        nest_asyncio.apply()  # Allow nested event loops
-
-        async def _chat():
-            messages = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": message})
-
-            response = await self.chat_completion(messages)
-            return response["choices"][0]["message"]["content"]
+    def chat(self, system: Optional[str], message: str, temperature: float = 0.7) -> str:
+        """Synchronous chat method for compatibility.
 
+        Blocks the calling (worker) thread while the request runs on the
+        shared background event loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._chat_async(system, message, temperature), _background_loop()
+        )
         try:
-            return asyncio.run(_chat())
+            return future.result()
         except Exception as e:
             return f"Error: {str(e)}"
 
+    async def _chat_async(self, system: Optional[str], message: str, temperature: float) -> str:
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": message})
+
+        response = await self.chat_completion(messages, temperature=temperature)
+        return response["choices"][0]["message"]["content"]
+
     async def chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
         """Adapt to old OpenAIClient interface."""
         if not self.client:
@@ -54,26 +77,42 @@ class OpenAIClientAdapter:
             "usage": response.usage or {}
         }
 
+    async def chat_completion_stream(self, messages: List[Dict[str, str]], **kwargs) -> AsyncIterator[str]:
+        """Yield response text chunks as they arrive."""
+        if not self.client:
+            raise Exception(f"No {self.provider} client configured")
+
+        async for text in self.client.chat_completion_stream(messages, **kwargs):
+            yield text
+
 
 class PromptManagerAdapter:
     """Adapter to make VaultManager work like the old PromptManager."""
 
     def __init__(self, vault_manager: VaultManager):
         self.vault = vault_manager
-
-    def get_all_prompts(self) -> List[Dict[str, Any]]:
-        """Get all prompts from vault."""
-        prompts = self.vault.get_lane_items("prompts")
-        return [
-            {
-                "id": p.id,
-                "title": p.title,
-                "content": p.content,
-                "tags": p.tags,
-                "category": "prompts"
-            }
-            for p in prompts
-        ]
+        self._cache: Tuple[Dict[str, Any], ...] = ()
+        self._cache_gen = -1
+
+    def get_all_prompts(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all prompts from vault.
+
+        Rebuilt only when the vault's generation has moved on; callers get the
+        shared cached tuple and must not modify the dicts in it.
+        """
+        if self._cache_gen != self.vault.generation:
+            self._cache = tuple(
+                {
+                    "id": p.id,
+                    "title": p.label,
+                    "content": p.value,
+                    "tags": p.tags,
+                    "category": "prompts"
+                }
+                for p in self.vault.get_lane_items("prompts")
+            )
+            self._cache_gen = self.vault.generation
+        return self._cache
 
     def save_prompt(self, title: str, content: str, tags: Optional[List[str]] = None) -> str:
         """Save a prompt to vault."""
@@ -112,6 +151,8 @@ class ShortcutsAdapter:
 
     def __init__(self, command_registry: CommandRegistry):
         self.registry = command_registry
+        # Next suffix to try per id root, so repeated labels don't re-probe
+        self._id_suffix: Dict[str, int] = {}
 
     def get_all_shortcuts(self) -> List[Dict[str, Any]]:
         """Get all commands as shortcuts."""
@@ -131,14 +172,15 @@ class ShortcutsAdapter:
     def add_shortcut(self, label: str, hotkey: str, action: str,
                     hotstring: str = "", tags: Optional[List[str]] = None) -> str:
         """Add a new shortcut/command."""
-        # Generate ID from label
-        shortcut_id = label.lower().replace(" ", "_")
-        existing_ids = {cmd.id for cmd in self.registry.all()}
-        counter = 1
-        original_id = shortcut_id
-        while shortcut_id in existing_ids:
-            shortcut_id = f"{original_id}_{counter}"
-            counter += 1
+        # Generate ID from label. registry.get() is a dict lookup, so the
+        # registry's own index is the source of truth for taken ids.
+        root = label.lower().replace(" ", "_")
+        n = self._id_suffix.get(root, 0)
+        shortcut_id = f"{root}_{n}" if n else root
+        while self.registry.get(shortcut_id) is not None:
+            n += 1
+            shortcut_id = f"{root}_{n}"
+        self._id_suffix[root] = n + 1
 
         from core.command_registry import Command
         cmd = Command(
@@ -5,13 +5,19 @@ Features:
 - Text-to-Speech with high-quality neural voices
 - Speech-to-Text from files or microphone
 - Voice selection
+
+In "simple" mode only the text-to-speech section is shown and no Whisper
+model is loaded.
 """
 
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from pathlib import Path
+
+from PySide6.QtCore import QTimer, Signal
 from PySide6.QtWidgets import (
     QComboBox,
+    QFileDialog,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -21,57 +27,92 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from core.audio_engine import AudioEngine, get_audio_engine
+
 from .base import BaseTab
 from .adapters import TTSAdapter
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional
 if TYPE_CHECKING:
     from core.tts_engine import TTSEngine
 
 
+# Voice picker entries: combo text -> Edge TTS voice id.
+_VOICES: Dict[str, str] = {
+    "en-US-BrianMultilingualNeural (Brian - Multilingual) ⭐": "en-US-BrianMultilingualNeural",
+    "en-US-GuyNeural (Male, Professional)": "en-US-GuyNeural",
+    "en-US-AriaNeural (Female, Friendly)": "en-US-AriaNeural",
+    "en-US-JennyNeural (Female, Warm)": "en-US-JennyNeural",
+    "en-GB-SoniaNeural (British Female)": "en-GB-SoniaNeural",
+    "en-AU-NatashaNeural (Australian Female)": "en-AU-NatashaNeural",
+}
+
+
 class AudioTab(BaseTab):
     """Audio/Voice interaction tab."""
 
     # Signals for thread-safe UI updates
     status_changed = Signal(str)
-
-    def __init__(self, tts_engine: TTSEngine):
+    transcription_ready = Signal(str)
+    controls_ready = Signal(bool)  # True when only TTS is available
+    task_finished = Signal(str)  # "speak", "record" or "academic"
+    academic_status_changed = Signal(str)
+    academic_saved = Signal(str)  # file path
+    academic_failed = Signal(str)  # error text
+
+    # Set once on the tab; labels pick their style up by objectName.
+    _STYLESHEET = """
+        QLabel#AudioStatus { color: #888; font-style: italic; padding: 5px; }
+        QLabel#AudioInfo { color: #888; font-size: 11px; }
+        QLabel#AcademicStatus { color: #888; font-style: italic; }
+        QPushButton#SpeakButton { padding: 10px; font-weight: bold; }
+    """
+
+    def __init__(self, tts_engine: TTSEngine,
+                 voices: Optional[List[Dict[str, str]]] = None,
+                 mode: Literal["full", "simple"] = "full"):
         super().__init__()
         self.tts = TTSAdapter(tts_engine)
+        self._mode = mode
+        # Voices enumerated ahead of time (off the UI thread), if any
+        self._voices = voices
         self._current_voice = "en-US-AriaNeural"
+        # Shared with app startup, which may already have loaded Whisper.
+        self.engine: AudioEngine = get_audio_engine(tts_engine)
+        self.floating_player = None
+        self._engine_ready = False
 
         # Connect signals
         self.status_changed.connect(self._update_status)
+        self.transcription_ready.connect(self._update_transcription)
+        self.controls_ready.connect(self._on_controls_ready)
+        self.task_finished.connect(self._on_task_finished)
+        self.academic_status_changed.connect(self._update_academic_status)
+        self.academic_saved.connect(self._on_academic_saved)
+        self.academic_failed.connect(self._on_academic_failed)
         
         self._build_ui()
-        
-        # Load engine in background
-        threading.Thread(target=self._load_engine, daemon=True).start()
+
+        if self._mode == "full":
+            # Load engine in background
+            self.run_in_pool(self._load_engine)
 
     def _load_engine(self) -> None:
         """Load audio engine in background thread."""
         self.status_changed.emit("⏳ Loading AI Models (Whisper + EdgeTTS)...")
         
         try:
-            self.engine = AudioEngine()
-            
-            # Initialize pygame for TTS
-            self.engine.initialize_pygame()
-            
-            # Initialize Whisper for STT (this takes a moment)
+            # Returns at once if the startup warmup already loaded the model.
             whisper_ok = self.engine.initialize_whisper()
             
-            # Create floating player with window control panel
-            self.floating_player = FloatingPlayer(self.engine, self.window_control_panel)
-            
             if whisper_ok:
                 self.status_changed.emit("✅ Audio Engine Ready (Whisper + EdgeTTS)")
                 self._engine_ready = True
-                self._enable_controls()
+                self.controls_ready.emit(False)
             else:
                 self.status_changed.emit("⚠️ Audio Engine Partially Ready (TTS only)")
                 self._engine_ready = True
-                self._enable_tts_only()
+                self.controls_ready.emit(True)
                 
         except Exception as e:
             self.status_changed.emit(f"❌ Error loading audio engine: {e}")
@@ -80,13 +121,14 @@ class AudioTab(BaseTab):
     def _build_ui(self) -> None:
         """Build the UI."""
         layout = QVBoxLayout(self)
+        self.setStyleSheet(self._STYLESHEET)
 
         # --- HEADER ---
         header_label = QLabel("<h2>🎙️ Voice Assistant</h2>")
         layout.addWidget(header_label)
 
-        self.lbl_status = QLabel("⏳ Initializing...")
-        self.lbl_status.setStyleSheet("color: #888; font-style: italic; padding: 5px;")
+        self.lbl_status = QLabel("⏳ Initializing..." if self._mode == "full" else "Ready")
+        self.lbl_status.setObjectName("AudioStatus")
         layout.addWidget(self.lbl_status)
 
         # --- SECTION 1: TEXT TO SPEECH ---
@@ -97,14 +139,14 @@ class AudioTab(BaseTab):
         voice_layout = QHBoxLayout()
         voice_layout.addWidget(QLabel("Voice:"))
         self.voice_combo = QComboBox()
-        self.voice_combo.addItems([
-            "en-US-BrianMultilingualNeural (Brian - Multilingual) ⭐",
-            "en-US-GuyNeural (Male, Professional)",
-            "en-US-AriaNeural (Female, Friendly)",
-            "en-US-JennyNeural (Female, Warm)",
-            "en-GB-SoniaNeural (British Female)",
-            "en-AU-NatashaNeural (Australian Female)",
-        ])
+        self._load_voices()
+        # Wheel/arrow-keying through voices fires a change per item; only
+        # apply the voice the selection settles on.
+        self._voice_debounce = QTimer(self)
+        self._voice_debounce.setSingleShot(True)
+        self._voice_debounce.setInterval(100)
+        self._voice_debounce.timeout.connect(self._apply_selected_voice)
+        # Connected after filling, so populating the combo emits nothing.
         self.voice_combo.currentTextChanged.connect(self._on_voice_changed)
         voice_layout.addWidget(self.voice_combo)
         voice_layout.addStretch()
@@ -118,23 +160,35 @@ class AudioTab(BaseTab):
         # Quick test buttons
         quick_layout = QHBoxLayout()
         self.btn_test1 = QPushButton("Test: 'Hello'")
-        self.btn_test1.clicked.connect(lambda: self.txt_input.setText("Hello, AI Hub is online."))
-        self.btn_test2 = QPushButton("Test: 'Jarvis'")
-        self.btn_test2.clicked.connect(lambda: self.txt_input.setText("Good morning, sir. All systems operational."))
+        self.btn_test1.clicked.connect(lambda: self.txt_input.setText("Hello, Stratum is online."))
         quick_layout.addWidget(self.btn_test1)
-        quick_layout.addWidget(self.btn_test2)
+        if self._mode == "full":
+            self.btn_test2 = QPushButton("Test: 'Jarvis'")
+            self.btn_test2.clicked.connect(lambda: self.txt_input.setText("Good morning, sir. All systems operational."))
+            quick_layout.addWidget(self.btn_test2)
+        self.btn_stop = QPushButton("Stop Speaking")
+        self.btn_stop.clicked.connect(self._stop_speaking)
+        quick_layout.addWidget(self.btn_stop)
         quick_layout.addStretch()
         tts_layout.addLayout(quick_layout)
 
         self.btn_speak = QPushButton("🔊 Speak Text")
-        self.btn_speak.setEnabled(False)
-        self.btn_speak.setStyleSheet("padding: 10px; font-weight: bold;")
+        # Full mode enables it once the engine has loaded.
+        self.btn_speak.setEnabled(self._mode == "simple")
+        self.btn_speak.setObjectName("SpeakButton")
         self.btn_speak.clicked.connect(self._run_tts)
         tts_layout.addWidget(self.btn_speak)
 
         tts_group.setLayout(tts_layout)
         layout.addWidget(tts_group)
 
+        if self._mode == "full":
+            self._build_full_sections(layout)
+
+        layout.addStretch()
+
+    def _build_full_sections(self, layout: QVBoxLayout) -> None:
+        """Add the academic TTS and speech-to-text sections."""
         # --- SECTION 1.5: ACADEMIC TEXT TO SPEECH ---
         academic_group = QGroupBox("🎓 Academic Text to Speech (Convert & Download)")
         academic_layout = QVBoxLayout()
@@ -143,7 +197,7 @@ class AudioTab(BaseTab):
             "Convert academic/complex text to natural speech and download as MP3.\n"
             "Perfect for listening to research papers, articles, or study materials!"
         )
-        info_academic.setStyleSheet("color: #888; font-size: 11px;")
+        info_academic.setObjectName("AudioInfo")
         academic_layout.addWidget(info_academic)
         
         self.txt_academic = QTextEdit()
@@ -169,7 +223,7 @@ class AudioTab(BaseTab):
         academic_layout.addLayout(academic_btn_layout)
         
         self.lbl_academic_status = QLabel("")
-        self.lbl_academic_status.setStyleSheet("color: #888; font-style: italic;")
+        self.lbl_academic_status.setObjectName("AcademicStatus")
         academic_layout.addWidget(self.lbl_academic_status)
         
         academic_group.setLayout(academic_layout)
@@ -183,7 +237,7 @@ class AudioTab(BaseTab):
             "Transcribe audio/video files or record from microphone.\n"
             "Supports: MP3, WAV, MP4, M4A, and more."
         )
-        info_label.setStyleSheet("color: #888; font-size: 11px;")
+        info_label.setObjectName("AudioInfo")
         stt_layout.addWidget(info_label)
 
         btn_layout = QHBoxLayout()
@@ -213,7 +267,38 @@ class AudioTab(BaseTab):
         stt_group.setLayout(stt_layout)
         layout.addWidget(stt_group)
 
-        layout.addStretch()
+    def _load_voices(self) -> None:
+        """Load available voices into combo box."""
+        # Combo text -> voice name, built once so selection is a dict lookup.
+        self._voice_map: Dict[str, str] = {}
+        if self._mode == "full":
+            self._voice_map = _VOICES
+            self.voice_combo.addItems(list(self._voice_map))
+            return
+
+        try:
+            voices = self._voices if self._voices is not None else self.tts.get_voices()
+            if voices:
+                self._voice_map = {
+                    f"{v['name']} ({v['language']})": v["name"] for v in voices[:5]  # Limit to 5
+                }
+            else:
+                # Fallback voices
+                self._voice_map = {
+                    "en-US-AriaNeural (Female)": "en-US-AriaNeural",
+                    "en-US-Zira (Female)": "en-US-Zira",
+                    "en-US-David (Male)": "en-US-David",
+                }
+            self.voice_combo.addItems(list(self._voice_map))
+        except Exception:
+            self.voice_combo.addItems(["Default Voice"])
+
+    def _on_controls_ready(self, tts_only: bool) -> None:
+        """Enable controls once the engine has loaded (GUI thread)."""
+        if tts_only:
+            self._enable_tts_only()
+        else:
+            self._enable_controls()
 
     def _enable_controls(self) -> None:
         """Enable all controls when engine is ready."""
@@ -231,22 +316,47 @@ class AudioTab(BaseTab):
         self.btn_transcribe.setEnabled(False)
         self.btn_record.setEnabled(False)
 
+    def _on_task_finished(self, task: str) -> None:
+        """Re-enable the buttons of a finished worker (GUI thread)."""
+        if task == "speak":
+            self.btn_speak.setEnabled(True)
+        elif task == "record":
+            self.btn_record.setEnabled(True)
+        elif task == "academic":
+            self.btn_academic_speak.setEnabled(True)
+            self.btn_academic_download.setEnabled(True)
+
     def _update_status(self, status: str) -> None:
         """Update status label (thread-safe)."""
         self.lbl_status.setText(status)
 
+    def _update_academic_status(self, status: str) -> None:
+        """Update academic status label (thread-safe)."""
+        self.lbl_academic_status.setText(status)
+
+    def _on_academic_saved(self, file_path: str) -> None:
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Academic audio saved successfully!\n\nLocation: {file_path}\n\nYou can now listen to it anytime!"
+        )
+
+    def _on_academic_failed(self, error: str) -> None:
+        QMessageBox.critical(self, "Error", f"Failed to save MP3:\n{error}")
+
     def _update_transcription(self, text: str) -> None:
         """Update transcription text (thread-safe)."""
         self.txt_transcription.setText(text)
 
     def _on_voice_changed(self, voice_text: str) -> None:
-        """Handle voice selection change."""
-        if not self.engine:
-            return
-        
-        # Extract voice ID from the combo text
-        voice_id = voice_text.split(" ")[0]
-        self.engine.set_voice(voice_id)
+        """Handle voice selection change (debounced)."""
+        self._voice_debounce.start()
+
+    def _apply_selected_voice(self) -> None:
+        voice_name = self._voice_map.get(self.voice_combo.currentText())
+        if voice_name:
+            self.tts.set_voice(voice_name)
+            self._current_voice = voice_name
 
     def _run_tts(self) -> None:
         """Run text-to-speech."""
@@ -267,6 +377,7 @@ class AudioTab(BaseTab):
             self.floating_player.set_speaking(text[:50] + "..." if len(text) > 50 else text)
 
         def speak_thread():
+            # Blocks this pool thread, not the UI, until playback ends.
             try:
                 success = self.engine.speak(text)
                 if success:
@@ -276,10 +387,17 @@ class AudioTab(BaseTab):
             except Exception as e:
                 self.status_changed.emit(f"❌ Error: {e}")
             finally:
-                # Re-enable button after a short delay
-                QTimer.singleShot(500, lambda: self.btn_speak.setEnabled(True))
+                self.task_finished.emit("speak")
+
+        self.run_in_pool(speak_thread)
 
-        threading.Thread(target=speak_thread, daemon=True).start()
+    def _stop_speaking(self) -> None:
+        """Stop current speech."""
+        try:
+            self.tts.stop()
+            self.status_changed.emit("Stopped")
+        except Exception as e:
+            self.status_changed.emit(f"Error stopping: {str(e)}")
 
     def _select_file(self) -> None:
         """Open file dialog to select audio/video file."""
@@ -303,17 +421,23 @@ class AudioTab(BaseTab):
 
         def record_thread():
             try:
-                file_path = self.engine.record_audio(duration=5)
-                if file_path:
-                    self._transcribe_file(file_path)
-                else:
+                samples = self.engine.record_audio(duration=5)
+                if samples is None:
                     self.status_changed.emit("❌ Recording failed")
+                    return
+
+                self.status_changed.emit("⏳ Transcribing recording...")
+                text = self.engine.transcribe_audio(
+                    samples, on_progress=self.transcription_ready.emit
+                )
+                self.transcription_ready.emit(text)
+                self.status_changed.emit("✅ Transcription complete")
             except Exception as e:
                 self.status_changed.emit(f"❌ Error: {e}")
             finally:
-                QTimer.singleShot(500, lambda: self.btn_record.setEnabled(True))
+                self.task_finished.emit("record")
 
-        threading.Thread(target=record_thread, daemon=True).start()
+        self.run_in_pool(record_thread)
 
     def _transcribe_file(self, file_path: str) -> None:
         """Transcribe an audio/video file."""
@@ -325,7 +449,9 @@ class AudioTab(BaseTab):
 
         def transcribe_thread():
             try:
-                text = self.engine.transcribe_file(file_path)
+                text = self.engine.transcribe_file(
+                    file_path, on_progress=self.transcription_ready.emit
+                )
                 self.transcription_ready.emit(text)
                 self.status_changed.emit("✅ Transcription complete")
             except Exception as e:
@@ -333,7 +459,7 @@ class AudioTab(BaseTab):
                 self.transcription_ready.emit(error_msg)
                 self.status_changed.emit(error_msg)
 
-        threading.Thread(target=transcribe_thread, daemon=True).start()
+        self.run_in_pool(transcribe_thread)
 
     def _copy_transcription(self) -> None:
         """Copy transcription to clipboard."""
@@ -364,16 +490,15 @@ class AudioTab(BaseTab):
             try:
                 success = self.engine.speak(text)
                 if success:
-                    self.lbl_academic_status.setText("✅ Done speaking")
+                    self.academic_status_changed.emit("✅ Done speaking")
                 else:
-                    self.lbl_academic_status.setText("❌ TTS failed")
+                    self.academic_status_changed.emit("❌ TTS failed")
             except Exception as e:
-                self.lbl_academic_status.setText(f"❌ Error: {e}")
+                self.academic_status_changed.emit(f"❌ Error: {e}")
             finally:
-                QTimer.singleShot(500, lambda: self.btn_academic_speak.setEnabled(True))
-                QTimer.singleShot(500, lambda: self.btn_academic_download.setEnabled(True))
+                self.task_finished.emit("academic")
         
-        threading.Thread(target=speak_thread, daemon=True).start()
+        self.run_in_pool(speak_thread)
     
     def _download_academic(self) -> None:
         """Download academic text as MP3 file."""
@@ -406,19 +531,14 @@ class AudioTab(BaseTab):
             try:
                 success = self.engine.save_to_file(text, file_path)
                 if success:
-                    self.lbl_academic_status.setText(f"✅ Saved to: {Path(file_path).name}")
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Academic audio saved successfully!\n\nLocation: {file_path}\n\nYou can now listen to it anytime!"
-                    )
+                    self.academic_status_changed.emit(f"✅ Saved to: {Path(file_path).name}")
+                    self.academic_saved.emit(file_path)
                 else:
-                    self.lbl_academic_status.setText("❌ Failed to save MP3")
+                    self.academic_status_changed.emit("❌ Failed to save MP3")
             except Exception as e:
-                self.lbl_academic_status.setText(f"❌ Error: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to save MP3:\n{e}")
+                self.academic_status_changed.emit(f"❌ Error: {e}")
+                self.academic_failed.emit(str(e))
             finally:
-                QTimer.singleShot(500, lambda: self.btn_academic_speak.setEnabled(True))
-                QTimer.singleShot(500, lambda: self.btn_academic_download.setEnabled(True))
+                self.task_finished.emit("academic")
         
-        threading.Thread(target=download_thread, daemon=True).start()
+        self.run_in_pool(download_thread)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Callable, Protocol
 
+from PySide6.QtCore import QRunnable, QThreadPool
 from PySide6.QtWidgets import QWidget
 
 
@@ -15,9 +16,24 @@ class Tab(Protocol):
         """Called when the tab is hidden."""
 
 
+class _PooledTask(QRunnable):
+    """Runs a plain callable on a QThreadPool."""
+
+    def __init__(self, fn: Callable[[], None]) -> None:
+        super().__init__()
+        self._fn = fn
+
+    def run(self) -> None:
+        self._fn()
+
+
 class BaseTab(QWidget):
     """Convenience base class providing no-op activate/deactivate hooks."""
 
+    def run_in_pool(self, fn: Callable[[], None]) -> None:
+        """Run fn on Qt's shared, bounded thread pool instead of a new thread."""
+        QThreadPool.globalInstance().start(_PooledTask(fn))
+
     def on_activate(self) -> None:  # pragma: no cover - UI hook
         pass
 
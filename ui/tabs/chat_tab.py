@@ -1,21 +1,70 @@
 from __future__ import annotations
 
-import threading
 import asyncio
+import hashlib
+from collections import OrderedDict
 
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import QLabel, QPushButton, QTextEdit, QVBoxLayout
 
 from .base import BaseTab
-from .adapters import OpenAIClientAdapter
+from .adapters import OpenAIClientAdapter, _background_loop
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 if TYPE_CHECKING:
     from core.ai_clients import AIClientManager
 
 
+# Replies kept in memory per tab, least recently used evicted first.
+_REPLY_CACHE_SIZE = 256
+
+
+class _ChatWorkerSignals(QObject):
+    chunk = Signal(str)
+    finished = Signal(str, str)  # cache key, reply
+    failed = Signal(str)  # error text
+
+
+class _ChatWorker:
+    """Streams one chat reply on the shared background event loop."""
+
+    def __init__(self, client: OpenAIClientAdapter, messages: List[Dict[str, str]], key: str,
+                 parent: QObject) -> None:
+        self.client = client
+        self.messages = messages
+        self.key = key
+        # Parented to the tab so the signals object is owned, and later
+        # deleted, on the GUI thread rather than wherever the worker dies.
+        self.signals = _ChatWorkerSignals(parent)
+
+    def start(self) -> None:
+        # The loop lives for the whole process, so a send doesn't build and
+        # tear down an event loop, and the HTTP session stays warm.
+        future = asyncio.run_coroutine_threadsafe(self._stream(), _background_loop())
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future) -> None:
+        # Runs on the loop thread; the signals are queued to the GUI thread.
+        try:
+            reply = future.result()
+        except Exception as e:
+            self.signals.failed.emit(f"Error: {str(e)}")
+        else:
+            self.signals.finished.emit(self.key, reply)
+
+    async def _stream(self) -> str:
+        # Stream the reply so text shows up while it is generated
+        parts = []
+        async for text in self.client.chat_completion_stream(self.messages):
+            parts.append(text)
+            self.signals.chunk.emit(text)
+        return "".join(parts)
+
+
 class ChatTab(BaseTab):
     request_started = Signal()
+    request_chunk = Signal(str)
     request_finished = Signal(str)
 
     def __init__(self, ai_manager: AIClientManager, system_default: str = "You are a helpful assistant."):
@@ -23,8 +72,16 @@ class ChatTab(BaseTab):
         # Create adapter for the AI manager
         self._client = OpenAIClientAdapter(ai_manager)
         self._system_default = system_default
+        # Exact (system, message, model) repeats are answered from here
+        # without touching the event loop or the API. Replies are sampled at
+        # temperature 0.7, so like the response cache this is opt-in via
+        # [stratum] response_cache; otherwise a resend asks again.
+        self._reply_cache_enabled = ai_manager.cache is not None
+        self._reply_cache: OrderedDict[str, str] = OrderedDict()
         self._build_ui()
+        self._received_chunk = False
         self.request_started.connect(self._on_request_started)
+        self.request_chunk.connect(self._on_request_chunk)
         self.request_finished.connect(self._on_request_finished)
 
     def _build_ui(self) -> None:
@@ -57,33 +114,64 @@ class ChatTab(BaseTab):
             return
         system = self.system_input.toPlainText().strip() or self._system_default
 
-        def run() -> None:
-            async def chat_task():
-                try:
-                    self.request_started.emit()
-                    # Prepare messages for chat completion
-                    messages = []
-                    if system:
-                        messages.append({"role": "system", "content": system})
-                    messages.append({"role": "user", "content": message})
-
-                    # Call the adapted client
-                    response = await self._client.chat_completion(messages)
-                    reply = response["choices"][0]["message"]["content"]
-                    self.request_finished.emit(reply)
-                except Exception as e:
-                    self.request_finished.emit(f"Error: {str(e)}")
+        # Prepare messages for chat completion
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": message})
+
+        key = self._reply_key(system, message)
+        cached = self._reply_cache.get(key) if self._reply_cache_enabled else None
+        if cached is not None:
+            self._reply_cache.move_to_end(key)
+            self.request_finished.emit(cached)
+            return
 
-            # Run async task in new event loop
-            asyncio.run(chat_task())
+        # Already on the GUI thread; no need to go through request_started.
+        self._on_request_started()
+        worker = _ChatWorker(self._client, messages, key, self)
+        worker.signals.chunk.connect(self.request_chunk)
+        worker.signals.finished.connect(self._on_worker_finished)
+        worker.signals.failed.connect(self._on_worker_failed)
+        worker.start()
+
+    def _reply_key(self, system: str, message: str) -> str:
+        client = self._client.client
+        model = getattr(client, "model", "") if client else ""
+        raw = f"{self._client.provider}\0{model}\0{system}\0{message}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    @Slot(str, str)
+    def _on_worker_finished(self, key: str, reply: str) -> None:
+        self.sender().deleteLater()
+        # Only successful replies are remembered; errors are retried.
+        if self._reply_cache_enabled:
+            self._reply_cache[key] = reply
+            self._reply_cache.move_to_end(key)
+            if len(self._reply_cache) > _REPLY_CACHE_SIZE:
+                self._reply_cache.popitem(last=False)
+        self.request_finished.emit(reply)
 
-        threading.Thread(target=run, daemon=True).start()
+    @Slot(str)
+    def _on_worker_failed(self, error: str) -> None:
+        self.sender().deleteLater()
+        self.request_finished.emit(error)
 
     @Slot()
     def _on_request_started(self) -> None:
+        self._received_chunk = False
         self.response_output.setPlainText("Thinking...")
         self.send_button.setEnabled(False)
 
+    @Slot(str)
+    def _on_request_chunk(self, text: str) -> None:
+        if not self._received_chunk:
+            self.response_output.clear()
+            self._received_chunk = True
+        cursor = self.response_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+
     @Slot(str)
     def _on_request_finished(self, reply: str) -> None:
         self.response_output.setPlainText(reply)
@@ -6,116 +6,338 @@ Floating window showing clipboard history with pin, hotkey, and preview features
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import (
+    Qt, QAbstractItemModel, QAbstractListModel, QEvent, QModelIndex, QObject, QRect, QSize,
+    QTimer, Signal
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QGuiApplication, QHelpEvent, QPainter
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QTextEdit, QLineEdit,
+    QAbstractItemView, QApplication, QListView, QStyle, QStyledItemDelegate,
+    QStyleOptionViewItem, QTextEdit, QLineEdit, QToolTip,
     QSplitter, QMessageBox, QInputDialog, QFrame
 )
 
 from ...services.clipboard_manager import ClipboardManager, ClipboardItem
 
 
-class ClipboardItemWidget(QWidget):
-    """Widget for a single clipboard item with actions."""
-    
-    copy_requested = Signal(str)  # item_id
-    pin_requested = Signal(str)   # item_id
-    delete_requested = Signal(str)  # item_id
-    preview_requested = Signal(str)  # item_id
-    hotkey_requested = Signal(str)  # item_id
-    
-    def __init__(self, item: ClipboardItem):
-        super().__init__()
-        self.item = item
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Left side: Content preview
-        content_layout = QVBoxLayout()
-        
-        # Label (if set)
-        if self.item.label:
-            label_text = QLabel(f"🏷️ {self.item.label}")
-            label_text.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            content_layout.addWidget(label_text)
-        
-        # Content preview
-        preview = QLabel(self.item.preview(80))
-        preview.setWordWrap(True)
-        preview.setStyleSheet("color: #E0E0E0; padding: 5px;")
-        content_layout.addWidget(preview)
-        
-        # Hotkey indicator
-        if self.item.hotkey:
-            hotkey_label = QLabel(f"⌨️ {self.item.hotkey}")
-            hotkey_label.setStyleSheet("color: #FF9800; font-size: 10px;")
-            content_layout.addWidget(hotkey_label)
-        
-        layout.addLayout(content_layout, stretch=3)
-        
-        # Right side: Action buttons
-        actions_layout = QVBoxLayout()
-        actions_layout.setSpacing(3)
-        
-        # Copy button
-        btn_copy = QPushButton("📋")
-        btn_copy.setToolTip("Copy to clipboard")
-        btn_copy.setFixedSize(35, 35)
-        btn_copy.clicked.connect(lambda: self.copy_requested.emit(self.item.id))
-        actions_layout.addWidget(btn_copy)
-        
-        # Pin button
-        pin_icon = "📌" if self.item.pinned else "📍"
-        btn_pin = QPushButton(pin_icon)
-        btn_pin.setToolTip("Pin/Unpin")
-        btn_pin.setFixedSize(35, 35)
-        btn_pin.clicked.connect(lambda: self.pin_requested.emit(self.item.id))
-        if self.item.pinned:
-            btn_pin.setStyleSheet("background-color: #4CAF50;")
-        actions_layout.addWidget(btn_pin)
-        
-        # Hotkey button
-        btn_hotkey = QPushButton("⌨️")
-        btn_hotkey.setToolTip("Set hotkey")
-        btn_hotkey.setFixedSize(35, 35)
-        btn_hotkey.clicked.connect(lambda: self.hotkey_requested.emit(self.item.id))
-        actions_layout.addWidget(btn_hotkey)
-        
-        # Preview button
-        btn_preview = QPushButton("🔍")
-        btn_preview.setToolTip("Double-click to preview")
-        btn_preview.setFixedSize(35, 35)
-        btn_preview.clicked.connect(lambda: self.preview_requested.emit(self.item.id))
-        actions_layout.addWidget(btn_preview)
-        
-        # Delete button (only if not pinned)
-        if not self.item.pinned:
-            btn_delete = QPushButton("🗑️")
-            btn_delete.setToolTip("Delete")
-            btn_delete.setFixedSize(35, 35)
-            btn_delete.clicked.connect(lambda: self.delete_requested.emit(self.item.id))
-            btn_delete.setStyleSheet("background-color: #F44336;")
-            actions_layout.addWidget(btn_delete)
-        
-        actions_layout.addStretch()
-        layout.addLayout(actions_layout, stretch=1)
+# Row layout for ClipboardItemDelegate, in pixels.
+_ROW_MARGIN = 5
+_BUTTON_SIZE = 35
+_BUTTON_SPACING = 3
+
+# (action, glyph, tooltip) for the buttons drawn on each row, left to right.
+# Pinned items can't be deleted, so they get no delete button.
+_PINNED_ACTIONS = (
+    ("copy", "📋", "Copy to clipboard"),
+    ("pin", "📌", "Pin/Unpin"),
+    ("hotkey", "⌨️", "Set hotkey"),
+    ("preview", "🔍", "Preview"),
+)
+_UNPINNED_ACTIONS = (
+    ("copy", "📋", "Copy to clipboard"),
+    ("pin", "📍", "Pin/Unpin"),
+    ("hotkey", "⌨️", "Set hotkey"),
+    ("preview", "🔍", "Preview"),
+    ("delete", "🗑️", "Delete"),
+)
+# Text is laid out left of the widest button strip, so it doesn't shift
+# when an item is pinned.
+_ACTIONS_WIDTH = len(_UNPINNED_ACTIONS) * (_BUTTON_SIZE + _BUTTON_SPACING) - _BUTTON_SPACING
+
+_PINNED_HEADER = "📌 PINNED"
+_RECENT_HEADER = "🕒 RECENT"
+# How many unpinned items the RECENT section shows.
+_RECENT_LIMIT = 50
+
+# The ClipboardItem behind a row.
+_ITEM_ROLE = Qt.UserRole + 1
+# The row's one-line preview text, computed once per item.
+_PREVIEW_ROLE = Qt.UserRole + 2
+_PREVIEW_CHARS = 80
+
+
+class ClipboardListModel(QAbstractListModel):
+    """One section of clipboard history (pinned or recent), in manager order."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._items: List[ClipboardItem] = []
+        self._row_of: Dict[str, int] = {}  # item id -> row
+        # Item content never changes, so neither does its preview; this saves
+        # re-scanning large clips every time a row is repainted.
+        self._previews: Dict[str, str] = {}
+        # Lowercased content for search, made once per item, not per keystroke.
+        self._lowered: Dict[str, str] = {}
+
+    def set_items(self, items: List[ClipboardItem]) -> None:
+        self.beginResetModel()
+        self._items = list(items)
+        self._row_of = {}
+        self._previews = {}
+        self._lowered = {}
+        self._reindex(0)
+        self.endResetModel()
+
+    def index_of(self, item_id: str) -> QModelIndex:
+        row = self._row_of.get(item_id)
+        return QModelIndex() if row is None else self.index(row)
+
+    def update_item(self, item_id: str) -> QModelIndex:
+        """Repaint one item's row after its label or hotkey changed."""
+        index = self.index_of(item_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+        return index
+
+    def insert_item(self, item: ClipboardItem, position: int) -> None:
+        row = min(position, len(self._items))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.insert(row, item)
+        self._reindex(row)
+        self.endInsertRows()
+
+    def remove_item(self, item_id: str) -> bool:
+        """Remove the item's row; False if it isn't in this section."""
+        row = self._row_of.pop(item_id, None)
+        if row is None:
+            return False
+        self._previews.pop(item_id, None)
+        self._lowered.pop(item_id, None)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        self._reindex(row)
+        self.endRemoveRows()
+        return True
+
+    def truncate(self, count: int) -> None:
+        """Drop items past the first count."""
+        while len(self._items) > count:
+            self.remove_item(self._items[-1].id)
+
+    def matches(self, row: int, needle: str) -> bool:
+        """Whether the item at row contains needle (already lowercased)."""
+        item = self._items[row]
+        lowered = self._lowered.get(item.id)
+        if lowered is None:
+            lowered = self._lowered[item.id] = item.content.lower()
+        return needle in lowered
+
+    def _reindex(self, start: int) -> None:
+        for row in range(start, len(self._items)):
+            self._row_of[self._items[row].id] = row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.UserRole:
+            return item.id
+        if role == _ITEM_ROLE:
+            return item
+        if role == _PREVIEW_ROLE:
+            preview = self._previews.get(item.id)
+            if preview is None:
+                preview = self._previews[item.id] = item.preview(_PREVIEW_CHARS)
+            return preview
+        return None
+
+
+class ClipboardItemDelegate(QStyledItemDelegate):
+    """
+    Paints clipboard rows straight onto the list view.
+
+    There is no widget tree per row: the label, preview and hotkey are drawn
+    as text, the buttons as glyphs, and clicks on them are hit-tested here
+    and reported through the single action_requested signal.
+    """
+
+    action_requested = Signal(str, str)  # item_id, action
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._label_color = QColor("#4CAF50")
+        self._text_color = QColor("#E0E0E0")
+        self._hotkey_color = QColor("#FF9800")
+        self._button_colors = {
+            "pin": QColor("#4CAF50"),  # only while pinned
+            "delete": QColor("#F44336"),
+        }
+        self._default_button_color = QColor("#3E3E3E")
+        # Derived from the view's font on first paint.
+        self._base_font: Optional[QFont] = None
+        self._bold_font = QFont()
+        self._small_font = QFont()
+        self._bold_metrics = QFontMetrics(self._bold_font)
+
+    def _update_fonts(self, base: QFont) -> None:
+        if base == self._base_font:
+            return
+        self._base_font = QFont(base)
+        self._bold_font = QFont(base)
+        self._bold_font.setBold(True)
+        self._small_font = QFont(base)
+        self._small_font.setPixelSize(10)
+        self._bold_metrics = QFontMetrics(self._bold_font)
+
+    @staticmethod
+    def _buttons(rect: QRect, pinned: bool) -> List[Tuple[str, str, str, QRect]]:
+        """(action, glyph, tooltip, rect) per button, right-aligned in rect."""
+        actions = _PINNED_ACTIONS if pinned else _UNPINNED_ACTIONS
+        x = rect.right() + 1 - _ROW_MARGIN - len(actions) * (_BUTTON_SIZE + _BUTTON_SPACING) + _BUTTON_SPACING
+        y = rect.top() + _ROW_MARGIN
+        buttons = []
+        for action, glyph, tooltip in actions:
+            buttons.append((action, glyph, tooltip, QRect(x, y, _BUTTON_SIZE, _BUTTON_SIZE)))
+            x += _BUTTON_SIZE + _BUTTON_SPACING
+        return buttons
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        line_height = option.fontMetrics.height()
+        item = index.data(_ITEM_ROLE)
+        lines = 1 + bool(item.label) + bool(item.hotkey)
+        return QSize(option.rect.width(), max(lines * line_height, _BUTTON_SIZE) + 2 * _ROW_MARGIN)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        painter.save()
+        try:
+            self._paint_item(painter, option, index, index.data(_ITEM_ROLE))
+        finally:
+            painter.restore()
+
+    def _paint_item(self, painter: QPainter, option: QStyleOptionViewItem,
+                    index: QModelIndex, item: ClipboardItem) -> None:
+        # Background, hover and selection come from the view's stylesheet.
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        self._update_fonts(option.font)
+        rect = option.rect
+        text_rect = rect.adjusted(_ROW_MARGIN, _ROW_MARGIN, -(2 * _ROW_MARGIN + _ACTIONS_WIDTH), -_ROW_MARGIN)
+        width = text_rect.width()
+        line_height = option.fontMetrics.height()
+        y = text_rect.top()
+
+        if item.label:
+            painter.setFont(self._bold_font)
+            painter.setPen(self._label_color)
+            painter.drawText(QRect(text_rect.left(), y, width, line_height), Qt.AlignLeft | Qt.AlignVCenter,
+                             self._bold_metrics.elidedText(f"🏷️ {item.label}", Qt.ElideRight, width))
+            y += line_height
+
+        painter.setFont(option.font)
+        painter.setPen(self._text_color)
+        painter.drawText(QRect(text_rect.left(), y, width, line_height), Qt.AlignLeft | Qt.AlignVCenter,
+                         option.fontMetrics.elidedText(index.data(_PREVIEW_ROLE), Qt.ElideRight, width))
+        y += line_height
+
+        if item.hotkey:
+            painter.setFont(self._small_font)
+            painter.setPen(self._hotkey_color)
+            painter.drawText(QRect(text_rect.left(), y, width, line_height), Qt.AlignLeft | Qt.AlignVCenter,
+                             f"⌨️ {item.hotkey}")
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(option.font)
+        for action, glyph, _tooltip, button in self._buttons(rect, item.pinned):
+            if action == "pin" and not item.pinned:
+                color = self._default_button_color
+            else:
+                color = self._button_colors.get(action, self._default_button_color)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(button, 4, 4)
+            painter.setPen(self._text_color)
+            painter.drawText(button, Qt.AlignCenter, glyph)
+
+    def editorEvent(self, event: QEvent, model: QAbstractItemModel,
+                    option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            item = index.data(_ITEM_ROLE)
+            if item is not None:
+                pos = event.position().toPoint()
+                for action, _glyph, _tooltip, button in self._buttons(option.rect, item.pinned):
+                    if button.contains(pos):
+                        self.action_requested.emit(item.id, action)
+                        return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event: QHelpEvent, view: QAbstractItemView,
+                  option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        item = index.data(_ITEM_ROLE)
+        if item is not None and event.type() == QEvent.ToolTip:
+            for _action, _glyph, tooltip, button in self._buttons(option.rect, item.pinned):
+                if button.contains(event.pos()):
+                    QToolTip.showText(event.globalPos(), tooltip, view)
+                    return True
+        return super().helpEvent(event, view, option, index)
 
 
 class ClipboardWindow(QWidget):
     """Main clipboard manager window."""
+
+    # One sheet for the whole window, so Qt parses it once.
+    _STYLESHEET = """
+        QListView#ClipboardList {
+            background-color: #1E1E1E;
+            border: 1px solid #3E3E3E;
+            border-radius: 5px;
+        }
+        QListView#ClipboardList::item {
+            padding: 5px;
+            border-bottom: 1px solid #2E2E2E;
+        }
+        QListView#ClipboardList::item:selected {
+            background-color: #2D5F8D;
+        }
+        QListView#ClipboardList::item:hover {
+            background-color: #2E2E2E;
+        }
+        QTextEdit#ClipboardPreview {
+            background-color: #1E1E1E;
+            color: #E0E0E0;
+            border: 1px solid #3E3E3E;
+            border-radius: 5px;
+            padding: 10px;
+            font-family: 'Consolas', monospace;
+        }
+        QLabel#ClipboardSection {
+            background-color: #2E4053;
+            color: #E0E0E0;
+            padding: 4px 10px;
+        }
+        QLabel#ClipboardStatus { color: #888; padding: 5px; }
+    """
     
     def __init__(self, storage_path: Path):
         super().__init__()
         self.manager = ClipboardManager(storage_path, max_history=100)
+        # Item shown in the preview panel, for Set Label.
+        self._current_preview_id: Optional[str] = None
         self.manager.on_new_item = self._on_new_item
+        # Row button action -> handler, for ClipboardItemDelegate clicks.
+        self._item_actions = {
+            "copy": self._on_copy,
+            "pin": self._on_pin,
+            "hotkey": self._on_set_hotkey,
+            "preview": self._on_preview,
+            "delete": self._on_delete,
+        }
         
         self._setup_ui()
         self._setup_monitoring()
@@ -128,6 +350,7 @@ class ClipboardWindow(QWidget):
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
+        self.setStyleSheet(self._STYLESHEET)
         
         # Header
         header = QHBoxLayout()
@@ -144,6 +367,11 @@ class ClipboardWindow(QWidget):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("🔍 Search clipboard...")
         self.search_box.textChanged.connect(self._on_search)
+        # Filter once typing pauses rather than on every keystroke.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
         header.addWidget(self.search_box)
         
         layout.addLayout(header)
@@ -151,27 +379,23 @@ class ClipboardWindow(QWidget):
         # Splitter: List on left, Preview on right
         splitter = QSplitter(Qt.Horizontal)
         
-        # Left: Clipboard list
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: #1E1E1E;
-                border: 1px solid #3E3E3E;
-                border-radius: 5px;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #2E2E2E;
-            }
-            QListWidget::item:selected {
-                background-color: #2D5F8D;
-            }
-            QListWidget::item:hover {
-                background-color: #2E2E2E;
-            }
-        """)
-        self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
-        splitter.addWidget(self.list_widget)
+        # Left: pinned and recent lists, each with its own model and a
+        # header label that is only shown while the list has items.
+        self.list_delegate = ClipboardItemDelegate(self)
+        self.list_delegate.action_requested.connect(self._on_item_action)
+        lists_panel = QWidget()
+        lists_layout = QVBoxLayout(lists_panel)
+        lists_layout.setContentsMargins(0, 0, 0, 0)
+        self.pinned_model, self.pinned_view = self._add_section(lists_layout, _PINNED_HEADER)
+        self.recent_model, self.recent_view = self._add_section(lists_layout, _RECENT_HEADER)
+        # Pinned items are few; recent gets the extra height.
+        lists_layout.setStretch(1, 1)
+        lists_layout.setStretch(3, 3)
+        self._sections = (
+            (self.pinned_model, self.pinned_view),
+            (self.recent_model, self.recent_view),
+        )
+        splitter.addWidget(lists_panel)
         
         # Right: Preview panel
         preview_panel = QWidget()
@@ -182,17 +406,8 @@ class ClipboardWindow(QWidget):
         preview_layout.addWidget(preview_label)
         
         self.preview_text = QTextEdit()
+        self.preview_text.setObjectName("ClipboardPreview")
         self.preview_text.setReadOnly(True)
-        self.preview_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1E1E1E;
-                color: #E0E0E0;
-                border: 1px solid #3E3E3E;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: 'Consolas', monospace;
-            }
-        """)
         preview_layout.addWidget(self.preview_text)
         
         # Preview actions
@@ -216,20 +431,51 @@ class ClipboardWindow(QWidget):
         
         # Status bar
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #888; padding: 5px;")
+        self.status_label.setObjectName("ClipboardStatus")
         layout.addWidget(self.status_label)
     
+    def _add_section(self, layout: QVBoxLayout, title: str) -> Tuple[ClipboardListModel, QListView]:
+        header = QLabel(title)
+        header.setObjectName("ClipboardSection")
+        layout.addWidget(header)
+
+        model = ClipboardListModel(self)
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(self.list_delegate)
+        view.setObjectName("ClipboardList")
+        view.setMouseTracking(True)  # hover highlight
+        view.doubleClicked.connect(self._on_item_double_clicked)
+        layout.addWidget(view)
+
+        def update_visibility():
+            has_items = model.rowCount() > 0
+            header.setVisible(has_items)
+            view.setVisible(has_items)
+
+        model.rowsInserted.connect(update_visibility)
+        model.rowsRemoved.connect(update_visibility)
+        model.modelReset.connect(update_visibility)
+        update_visibility()
+        return model, view
+    
     def _setup_monitoring(self):
         """Start clipboard monitoring."""
-        self.monitor_timer = QTimer(self)
-        self.monitor_timer.timeout.connect(self._check_clipboard)
-        self.monitor_timer.start(1000)  # Check every second
+        # Qt signals real clipboard changes, so the window stays idle
+        # while nothing is being copied.
+        QGuiApplication.clipboard().dataChanged.connect(self._check_clipboard)
+        if sys.platform.startswith("linux"):
+            # Some X11 clipboard owners don't trigger dataChanged; a slow
+            # poll catches those. check_clipboard() skips unchanged text.
+            self.monitor_timer = QTimer(self)
+            self.monitor_timer.timeout.connect(self._check_clipboard)
+            self.monitor_timer.start(5000)
     
     def _check_clipboard(self):
         """Check for new clipboard content."""
         item = self.manager.check_clipboard()
         if item:
-            self._refresh_list()
+            self._place_item(item)
     
     def _on_new_item(self, item: ClipboardItem):
         """Called when new item is added."""
@@ -237,45 +483,50 @@ class ClipboardWindow(QWidget):
     
     def _refresh_list(self):
         """Refresh the clipboard list."""
-        self.list_widget.clear()
-        
-        # Add pinned items first
-        pinned = self.manager.get_pinned_items()
-        if pinned:
-            header = QListWidgetItem("📌 PINNED")
-            header.setFlags(Qt.NoItemFlags)
-            header.setBackground(QColor("#2E4053"))
-            self.list_widget.addItem(header)
-            
-            for item in pinned:
-                self._add_item_to_list(item)
-        
-        # Add recent items
-        recent = self.manager.get_recent_items(50)
-        if recent:
-            header = QListWidgetItem("🕒 RECENT")
-            header.setFlags(Qt.NoItemFlags)
-            header.setBackground(QColor("#2E4053"))
-            self.list_widget.addItem(header)
-            
-            for item in recent:
-                self._add_item_to_list(item)
+        # Rows are painted by the delegate.
+        self.pinned_model.set_items(self.manager.get_pinned_items())
+        self.recent_model.set_items(self.manager.get_recent_items(_RECENT_LIMIT))
+
+    def _place_item(self, item: ClipboardItem):
+        """Move (or add) item's row to where the manager now lists it."""
+        self._remove_row(item.id)
+        if item.pinned:
+            model, section = self.pinned_model, self.manager.get_pinned_items()
+        else:
+            model, section = self.recent_model, self.manager.get_recent_items(_RECENT_LIMIT)
+        for position, listed in enumerate(section):
+            if listed.id == item.id:
+                model.insert_item(item, position)
+                break
+        self._sync_recent_tail()
+        self._refilter()
+
+    def _sync_recent_tail(self):
+        """Keep RECENT at the manager's newest _RECENT_LIMIT unpinned items."""
+        recent = self.manager.get_recent_items(_RECENT_LIMIT)
+        self.recent_model.truncate(len(recent))
+        for item in recent[self.recent_model.rowCount():]:
+            self.recent_model.insert_item(item, self.recent_model.rowCount())
+
+    def _refilter(self):
+        """Re-apply an active search to rows that were added or reset."""
+        if self.search_box.text():
+            self._search_timer.start()
+
+    def _remove_row(self, item_id: str) -> bool:
+        return any(model.remove_item(item_id) for model, _view in self._sections)
+
+    def _update_row(self, item_id: str):
+        """Repaint an item whose label or hotkey changed; its height may differ."""
+        for model, _view in self._sections:
+            index = model.update_item(item_id)
+            if index.isValid():
+                self.list_delegate.sizeHintChanged.emit(index)
+                return
     
-    def _add_item_to_list(self, item: ClipboardItem):
-        """Add an item to the list."""
-        list_item = QListWidgetItem(self.list_widget)
-        widget = ClipboardItemWidget(item)
-        
-        # Connect signals
-        widget.copy_requested.connect(self._on_copy)
-        widget.pin_requested.connect(self._on_pin)
-        widget.delete_requested.connect(self._on_delete)
-        widget.preview_requested.connect(self._on_preview)
-        widget.hotkey_requested.connect(self._on_set_hotkey)
-        
-        list_item.setSizeHint(widget.sizeHint())
-        list_item.setData(Qt.UserRole, item.id)
-        self.list_widget.setItemWidget(list_item, widget)
+    def _on_item_action(self, item_id: str, action: str):
+        """Handle a click on one of a row's buttons."""
+        self._item_actions[action](item_id)
     
     def _on_copy(self, item_id: str):
         """Copy item to clipboard."""
@@ -285,26 +536,31 @@ class ClipboardWindow(QWidget):
     def _on_pin(self, item_id: str):
         """Toggle pin status."""
         pinned = self.manager.toggle_pin(item_id)
-        self._refresh_list()
+        item = self.manager.get_item_by_id(item_id)
+        if item:
+            self._place_item(item)
         status = "pinned" if pinned else "unpinned"
         self.status_label.setText(f"📌 Item {status}")
     
     def _on_delete(self, item_id: str):
         """Delete item."""
         if self.manager.delete_item(item_id):
-            self._refresh_list()
+            self._remove_row(item_id)
+            self._sync_recent_tail()
+            self._refilter()
             self.status_label.setText("🗑️ Item deleted")
     
     def _on_preview(self, item_id: str):
         """Show item preview."""
         item = self.manager.get_item_by_id(item_id)
         if item:
+            self._current_preview_id = item_id
             self.preview_text.setPlainText(item.content)
             self.status_label.setText(f"👁️ Previewing: {item.preview(30)}")
     
-    def _on_item_double_clicked(self, list_item: QListWidgetItem):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double-click on item."""
-        item_id = list_item.data(Qt.UserRole)
+        item_id = index.data(Qt.UserRole)
         if item_id:
             self._on_preview(item_id)
     
@@ -329,39 +585,36 @@ class ClipboardWindow(QWidget):
             else:
                 self.manager.set_hotkey(item_id, None)
                 self.status_label.setText("⌨️ Hotkey removed")
-            self._refresh_list()
+            self._update_row(item_id)
     
     def _set_label(self):
         """Set label for current preview item."""
-        content = self.preview_text.toPlainText()
-        if not content:
+        if self._current_preview_id is None:
+            return
+        item = self.manager.get_item_by_id(self._current_preview_id)
+        if item is None:
             return
         
-        # Find item by content
-        for item in self.manager.items:
-            if item.content == content:
-                label, ok = QInputDialog.getText(
-                    self,
-                    "Set Label",
-                    "Enter a label for this item:",
-                    text=item.label or ""
-                )
-                if ok:
-                    if label.strip():
-                        self.manager.set_label(item.id, label.strip())
-                        self.status_label.setText(f"🏷️ Label set: {label}")
-                    else:
-                        self.manager.set_label(item.id, None)
-                        self.status_label.setText("🏷️ Label removed")
-                    self._refresh_list()
-                break
+        label, ok = QInputDialog.getText(
+            self,
+            "Set Label",
+            "Enter a label for this item:",
+            text=item.label or ""
+        )
+        if ok:
+            if label.strip():
+                self.manager.set_label(item.id, label.strip())
+                self.status_label.setText(f"🏷️ Label set: {label}")
+            else:
+                self.manager.set_label(item.id, None)
+                self.status_label.setText("🏷️ Label removed")
+            self._update_row(item.id)
     
     def _copy_preview(self):
         """Copy preview content to clipboard."""
         content = self.preview_text.toPlainText()
         if content:
-            import pyperclip
-            pyperclip.copy(content)
+            QGuiApplication.clipboard().setText(content)
             self.status_label.setText("✅ Preview copied to clipboard!")
     
     def _clear_unpinned(self):
@@ -375,15 +628,17 @@ class ClipboardWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             count = self.manager.clear_unpinned()
-            self._refresh_list()
+            # Pinned items are untouched; only the recent list changes.
+            self.recent_model.set_items(self.manager.get_recent_items(_RECENT_LIMIT))
+            self._refilter()
             self.status_label.setText(f"🗑️ Cleared {count} items")
     
     def _on_search(self, text: str):
         """Filter items by search text."""
-        # Simple search - could be enhanced
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            if widget and hasattr(widget, 'item'):
-                visible = text.lower() in widget.item.content.lower()
-                item.setHidden(not visible)
+        self._search_timer.start()
+
+    def _apply_search(self):
+        needle = self.search_box.text().lower()
+        for model, view in self._sections:
+            for row in range(model.rowCount()):
+                view.setRowHidden(row, not model.matches(row, needle))